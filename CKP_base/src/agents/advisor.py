@@ -1,30 +1,18 @@
-from datetime import datetime
+import time
 from src.core.base_agent import BaseAgent
 from src.core.state import AdvisoryState, AnalysisPhase
+from src.agents.fused_core import advise
 
 class AdvisorAgent(BaseAgent):
+	is_sync = True
+
 	def __init__(self):
 		super().__init__(name="advisor")
 
-	async def process(self, state: AdvisoryState) -> AdvisoryState:
-		recos = []
-		alerts = state.get("alerts", [])
-		for a in alerts:
-			if a.get("id") == "liquidity_risk":
-				recos.append({
-					"title": "Improve liquidity",
-					"action": "Negotiate longer payment terms; offer early-payment discount to customers",
-					"expected_impact": "+0.2-0.4 to current ratio",
-					"ts": datetime.utcnow().isoformat(),
-				})
-			if a.get("id") == "low_overall_health":
-				recos.append({
-					"title": "Reduce OPEX 5%",
-					"action": "Cut discretionary spend and renegotiate key vendor contracts",
-					"expected_impact": "+2-4 pts to health",
-					"ts": datetime.utcnow().isoformat(),
-				})
-		state["recommendations"] = recos
-		state.setdefault("confidence_scores", {})["advisory"] = 0.55
-		state["current_phase"] = AnalysisPhase.ADVISORY
+	def process_sync(self, state: AdvisoryState) -> AdvisoryState:
+		state.current_phase = AnalysisPhase.ADVISORY
+		advise(state, time.time_ns())
 		return state
+
+	async def process(self, state: AdvisoryState) -> AdvisoryState:
+		return self.process_sync(state)
@@ -0,0 +1,46 @@
+from math import isfinite
+
+try:
+	from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+	def njit(*args, **kwargs):
+		if len(args) == 1 and callable(args[0]) and not kwargs:
+			return args[0]
+		return lambda fn: fn
+
+# fastmath without nnan/ninf so the isfinite() guard is not optimized away
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def _clip_shift(value: float, lo: float) -> float:
+	# Every health band spans 100 units, so mapping [lo, lo + 100] to [0, 100] is a shift
+	return max(0.0, min(100.0, value - lo)) if isfinite(value) else 0.0
+
+@njit(cache=True, fastmath=_FASTMATH, error_model="numpy")
+def compute(revenue, cogs, opex, interest, cash, current_assets, current_liabilities, short_term_debt):
+	"""Pure-float analyzer kernel.
+
+	Returns (gross_profit, ebit, net_income, current_ratio,
+	profitability, liquidity, cash_flow, debt, overall).
+	"""
+	gross_profit = revenue - cogs
+	ebit = gross_profit - opex
+	net_income = ebit - interest
+
+	# current_ratio is reported and compared against 1.0, so it takes an exact division
+	current_ratio = current_assets / current_liabilities if current_liabilities else 0.0
+
+	# Reciprocals up front (zero-guarded) for the health terms, which are clipped anyway
+	inv_rev = 1.0 / revenue if revenue else 0.0
+	inv_monthly_rev = 1.0 / max(revenue / 12, 1.0)
+	inv_ca = 1.0 / max(current_assets, 1.0)
+
+	profitability_health = _clip_shift(net_income * inv_rev * 100, -50.0)
+	liquidity_health = _clip_shift((current_ratio - 1.0) * 50, 0.0)
+	cash_flow_health = _clip_shift(cash * inv_monthly_rev * 20, 0.0)
+	debt_health = _clip_shift((1 - min(short_term_debt * inv_ca, 1.0)) * 100, 0.0)
+	overall = (profitability_health * 0.35 + liquidity_health * 0.25 + cash_flow_health * 0.25 + debt_health * 0.15)
+	return (
+		gross_profit, ebit, net_income, current_ratio,
+		profitability_health, liquidity_health, cash_flow_health, debt_health, overall,
+	)
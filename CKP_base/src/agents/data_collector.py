@@ -1,14 +1,14 @@
 import asyncio
-from datetime import datetime
+import time
 from src.core.base_agent import BaseAgent
-from src.core.state import AdvisoryState, AnalysisPhase
+from src.core.state import AdvisoryState, AnalysisPhase, raw_vector, ts_fields
 
 class DataCollectorAgent(BaseAgent):
 	def __init__(self):
 		super().__init__(name="data_collector")
 
 	async def process(self, state: AdvisoryState) -> AdvisoryState:
-		state["current_phase"] = AnalysisPhase.DATA_COLLECTION
+		state.current_phase = AnalysisPhase.DATA_COLLECTION
 
 		async def _mock_erp():
 			await asyncio.sleep(0.2)
@@ -24,11 +24,13 @@ class DataCollectorAgent(BaseAgent):
 
 		erp, acc, bank = await asyncio.gather(_mock_erp(), _mock_accounting(), _mock_bank())
 
-		state["raw_data"] = {"erp": erp, "accounting": acc, "bank": bank}
-		state["data_sources"] = ["mock_erp", "mock_accounting", "mock_bank"]
-		state["last_sync_timestamp"] = datetime.utcnow()
-		state.setdefault("messages", []).append({
-			"ts": datetime.utcnow().isoformat(),
+		state.raw_data = {"erp": erp, "accounting": acc, "bank": bank}
+		state.raw_vec = raw_vector(state.raw_data)
+		state.data_sources = ["mock_erp", "mock_accounting", "mock_bank"]
+		now_ns = time.time_ns()
+		state.last_sync_timestamp = now_ns
+		state.messages.append({
+			**ts_fields(now_ns),
 			"agent": "data_collector",
 			"msg": "Thu thập dữ liệu mock xong"
 		})
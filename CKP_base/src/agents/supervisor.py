@@ -1,18 +1,17 @@
 from src.core.base_agent import BaseAgent
 from src.core.state import AdvisoryState, AnalysisPhase
+from src.agents.fused_core import supervise
 
 class SupervisorAgent(BaseAgent):
+	is_sync = True
+
 	def __init__(self):
 		super().__init__(name="supervisor")
 
-	async def process(self, state: AdvisoryState) -> AdvisoryState:
-		conf = state.get("confidence_scores", {})
-		overall = (
-			conf.get("analysis", 0.0) * 0.4
-			+ conf.get("forecast", 0.0) * 0.25
-			+ conf.get("alerts", 0.0) * 0.2
-			+ conf.get("explanations", 0.0) * 0.15
-		)
-		state.setdefault("confidence_scores", {})["overall"] = overall
-		state["current_phase"] = AnalysisPhase.COMPLETE
+	def process_sync(self, state: AdvisoryState) -> AdvisoryState:
+		state.current_phase = AnalysisPhase.COMPLETE
+		supervise(state)
 		return state
+
+	async def process(self, state: AdvisoryState) -> AdvisoryState:
+		return self.process_sync(state)
@@ -1,11 +1,16 @@
-from fastapi import FastAPI
-from fastapi.responses import StreamingResponse
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
-import json
+from typing import Optional, Dict, Any, AsyncIterator
+from functools import lru_cache
+from contextlib import asynccontextmanager
+import asyncio
+import base64
+import orjson
 import uuid
 
 from src.core.orchestrator import AdvisoryOrchestrator
+from src.core.pipeline_cache import pipeline_cache
 from src.core.state import AdvisoryState, AnalysisPhase
 from src.agents.data_collector import DataCollectorAgent
 from src.agents.analyzer import FinancialAnalyzerAgent
@@ -15,18 +20,97 @@ from src.agents.advisor import AdvisorAgent
 from src.agents.explainer import ExplainerAgent
 from src.agents.supervisor import SupervisorAgent
 
-app = FastAPI(title="AI CFO Advisory API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	# Build agents once per worker at startup rather than at import time
+	app.state.agents = {
+		"data_collector": DataCollectorAgent(),
+		"analyzer": FinancialAnalyzerAgent(),
+		"forecaster": ForecasterAgent(),
+		"alert_manager": AlertManagerAgent(),
+		"advisor": AdvisorAgent(),
+		"explainer": ExplainerAgent(),
+		"supervisor": SupervisorAgent(),
+	}
+	app.state.orchestrator = AdvisoryOrchestrator(app.state.agents, fused=True, cache=pipeline_cache)
+	try:
+		yield
+	finally:
+		pipeline_cache.clear()
+		app.state.orchestrator = None
+		app.state.agents = None
+
+app = FastAPI(title="AI CFO Advisory API", lifespan=lifespan)
+
+# Stop reverse proxies (nginx) from buffering the event stream
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+@lru_cache(maxsize=None)
+def _sse_response_class():
+	# fastapi.sse ships with FastAPI >= 0.135; older installs keep the plain stream
+	try:
+		from fastapi.sse import EventSourceResponse
+	except ImportError:
+		return StreamingResponse
+	return EventSourceResponse
+
+# Fixed SSE frame; only the two values are encoded, no payload dict per event
+_SSE_FRAME = b'data: {"event":%b,"data":%b}\n\n'
+
+def _dumps_sse(value: Any) -> bytes:
+	return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
 
-_agents = {
-	"data_collector": DataCollectorAgent(),
-	"analyzer": FinancialAnalyzerAgent(),
-	"forecaster": ForecasterAgent(),
-	"alert_manager": AlertManagerAgent(),
-	"advisor": AdvisorAgent(),
-	"explainer": ExplainerAgent(),
-	"supervisor": SupervisorAgent(),
-}
-_orchestrator = AdvisoryOrchestrator(_agents)
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _orjson_default(obj: Any) -> Any:
+	# Only FinancialHealth (pydantic) falls outside orjson's native types
+	if isinstance(obj, BaseModel):
+		return obj.model_dump()
+	return str(obj)
+
+# Coalesce SSE frames: flush after 5ms or once 16 KB are buffered
+_FLUSH_SECS = 0.005
+_FLUSH_BYTES = 16384
+
+async def _coalesce(frames: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+	loop = asyncio.get_running_loop()
+	buf = bytearray()
+	deadline = None
+	# Keep one pending anext() across timeouts; cancelling it would break the source generator
+	pending = None
+	try:
+		while True:
+			if pending is None:
+				pending = asyncio.ensure_future(anext(frames))
+			timeout = None if deadline is None else max(deadline - loop.time(), 0.0)
+			done, _ = await asyncio.wait((pending,), timeout=timeout)
+			if not done:
+				yield bytes(buf)
+				buf.clear()
+				deadline = None
+				continue
+			try:
+				frame = pending.result()
+			except StopAsyncIteration:
+				break
+			finally:
+				pending = None
+			buf += frame
+			if deadline is None:
+				deadline = loop.time() + _FLUSH_SECS
+			if len(buf) >= _FLUSH_BYTES or loop.time() >= deadline:
+				yield bytes(buf)
+				buf.clear()
+				deadline = None
+		if buf:
+			yield bytes(buf)
+	finally:
+		if pending is not None:
+			pending.cancel()
+
+def _gen_request_id() -> str:
+	# 22-char url-safe form of a uuid4; skips the 36-char hex-dash formatting
+	return base64.urlsafe_b64encode(uuid.uuid4().bytes).rstrip(b"=").decode("ascii")
 
 class AdvisoryRequest(BaseModel):
 	company_id: str
@@ -36,28 +120,23 @@ class AdvisoryRequest(BaseModel):
 	streaming: bool = False
 
 @app.post("/api/v1/advisory/analyze")
-async def analyze(req: AdvisoryRequest):
-	initial_state: AdvisoryState = {
-		"request_id": str(uuid.uuid4()),
-		"user_id": req.user_id,
-		"company_id": req.company_id,
-		"request_type": req.request_type,
-		"current_phase": AnalysisPhase.DATA_COLLECTION,
-		"messages": [],
-		"raw_data": {},
-		"key_metrics": {},
-		"confidence_scores": {},
-		"errors": [],
-	}
-	if req.parameters:
-		initial_state.setdefault("parameters", {}).update(req.parameters)
+async def analyze(req: AdvisoryRequest, request: Request):
+	orchestrator = request.app.state.orchestrator
+	initial_state = AdvisoryState(
+		request_id=_gen_request_id(),
+		user_id=req.user_id,
+		company_id=req.company_id,
+		request_type=req.request_type,
+		current_phase=AnalysisPhase.DATA_COLLECTION,
+		parameters=dict(req.parameters or {}),
+	)
 
 	if req.streaming:
 		async def event_source():
-			async for event in _orchestrator.astream_events(initial_state):
-				payload = {"event": event.get("event"), "data": event.get("data")}
-				yield f"data: {json.dumps(payload, default=str)}\n\n"
-		return StreamingResponse(event_source(), media_type="text/event-stream")
+			async for event in orchestrator.astream_events(initial_state):
+				yield _SSE_FRAME % (_dumps_sse(event.get("event")), _dumps_sse(event.get("data")))
+		return _sse_response_class()(_coalesce(event_source()), media_type="text/event-stream", headers=_SSE_HEADERS)
 
-	final_state = await _orchestrator.ainvoke(initial_state)
-	return final_state
+	final_state = await orchestrator.ainvoke(initial_state)
+	# Serialize once with orjson instead of jsonable_encoder + json.dumps
+	return Response(orjson.dumps(final_state, default=_orjson_default, option=_ORJSON_OPTS), media_type="application/json")
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 import time
+from contextlib import contextmanager
 import structlog
 from opentelemetry import trace
 from src.core.state import AdvisoryState
@@ -9,6 +10,10 @@ tracer = trace.get_tracer(__name__)
 logger = structlog.get_logger()
 
 class BaseAgent(ABC):
+	# Agents that never await set is_sync and implement process_sync; the
+	# orchestrator then calls execute_sync and skips coroutine scheduling.
+	is_sync: bool = False
+
 	def __init__(self, name: str):
 		self.name = name
 
@@ -16,21 +21,31 @@ class BaseAgent(ABC):
 	async def process(self, state: AdvisoryState) -> AdvisoryState:
 		raise NotImplementedError
 
-	@tracer.start_as_current_span("agent.execute")
+	def process_sync(self, state: AdvisoryState) -> AdvisoryState:
+		raise NotImplementedError
+
+	@contextmanager
+	def _observe(self, state: AdvisoryState):
+		with tracer.start_as_current_span("agent.execute") as span:
+			span.set_attribute("agent.name", self.name)
+			start = time.perf_counter()
+			logger.info("agent_start", agent=self.name)
+			try:
+				yield
+			except Exception as e:
+				logger.error("agent_error", agent=self.name, error=str(e))
+				state.errors.append(f"{self.name}: {e}")
+				span.record_exception(e)
+				raise
+			finally:
+				elapsed = time.perf_counter() - start
+				logger.info("agent_end", agent=self.name, elapsed=elapsed)
+				span.set_attribute("agent.elapsed", elapsed)
+
 	async def execute(self, state: AdvisoryState) -> AdvisoryState:
-		span = trace.get_current_span()
-		span.set_attribute("agent.name", self.name)
-		start = time.perf_counter()
-		logger.info("agent_start", agent=self.name)
-		try:
-			new_state = await self.process(state)
-			return new_state
-		except Exception as e:
-			logger.error("agent_error", agent=self.name, error=str(e))
-			state.setdefault("errors", []).append(f"{self.name}: {e}")
-			span.record_exception(e)
-			raise
-		finally:
-			elapsed = time.perf_counter() - start
-			logger.info("agent_end", agent=self.name, elapsed=elapsed)
-			span.set_attribute("agent.elapsed", elapsed)
+		with self._observe(state):
+			return await self.process(state)
+
+	def execute_sync(self, state: AdvisoryState) -> AdvisoryState:
+		with self._observe(state):
+			return self.process_sync(state)
@@ -1,86 +1,123 @@
-from typing import Dict, AsyncGenerator, Literal
-from datetime import datetime
-from src.core.state import AdvisoryState, AnalysisPhase
+from typing import Dict, AsyncGenerator, Literal, Optional
+import asyncio
+import time
+from src.core.state import AdvisoryState, AnalysisPhase, ts_fields
 from src.core.base_agent import BaseAgent
+from src.core.pipeline_cache import PipelineCache, make_key
+from src.agents.fused_core import process_core
+
+# (agent, event emitted after it) per flow
+_FLOWS = {
+	"full_analysis": (
+		("data_collector", "data_collection"),
+		("analyzer", "analysis"),
+		("forecaster", "forecasting"),
+		("alert_manager", None),
+		("advisor", None),
+		("explainer", None),
+		("supervisor", "complete"),
+	),
+	"quick_check": (
+		("analyzer", "analysis"),
+		("forecaster", "forecasting"),
+		("alert_manager", None),
+		("advisor", None),
+		("explainer", None),
+		("supervisor", "complete"),
+	),
+}
+# forecast / what_if minimal
+_DEFAULT_FLOW = (
+	("forecaster", "forecasting"),
+	("explainer", None),
+	("supervisor", "complete"),
+)
+
+# Events buffered ahead of a slow stream consumer before the pipeline waits
+_STREAM_PREFETCH = 64
+_STREAM_DONE = object()
 
 class AdvisoryOrchestrator:
-	def __init__(self, agents: Dict[str, BaseAgent]):
+	def __init__(self, agents: Dict[str, BaseAgent], fused: bool = False, cache: Optional[PipelineCache] = None):
 		self.agents = agents
+		# fused: run the post-collection tail via process_core when nobody streams per-node events
+		self.fused = fused
+		# cache: skip the post-collection tail when raw_data/parameters were seen before
+		self.cache = cache
 
 	async def _route_request(self, state: AdvisoryState) -> AdvisoryState:
-		state["current_phase"] = AnalysisPhase.DATA_COLLECTION
-		state.setdefault("messages", []).append({
-			"ts": datetime.utcnow().isoformat(),
+		state.current_phase = AnalysisPhase.DATA_COLLECTION
+		state.messages.append({
+			**ts_fields(time.time_ns()),
 			"agent": "router",
-			"msg": f"request_type={state.get('request_type')}"
+			"msg": f"request_type={state.request_type}"
 		})
-		state.setdefault("raw_data", {})
-		state.setdefault("key_metrics", {})
-		state.setdefault("confidence_scores", {})
-		state.setdefault("errors", [])
 		return state
 
 	def _determine_flow(self, state: AdvisoryState) -> Literal["full_analysis", "quick_check", "forecast", "what_if"]:
-		return state.get("request_type", "quick_check")
+		return state.request_type or "quick_check"
 
 	async def _run_pipeline(self, state: AdvisoryState, emit=None) -> AdvisoryState:
 		# router
 		state = await self._route_request(state)
 		if emit:
-			await emit({"event": "router", "data": {"phase": str(state["current_phase"])}})
+			await emit({"event": "router", "data": {"phase": str(state.current_phase)}})
 
 		flow = self._determine_flow(state)
-		if flow in ("full_analysis",):
-			# data_collector -> analyzer -> forecaster -> alert_manager -> advisor -> explainer -> supervisor
-			state = await self.agents["data_collector"].execute(state)
-			if emit:
-				await emit({"event": "data_collection", "data": {"phase": str(state["current_phase"])}})
-			state = await self.agents["analyzer"].execute(state)
-			if emit:
-				await emit({"event": "analysis", "data": {"phase": str(state["current_phase"],)}})
-			state = await self.agents["forecaster"].execute(state)
-			if emit:
-				await emit({"event": "forecasting", "data": {"phase": str(state["current_phase"])}})
-			state = await self.agents["alert_manager"].execute(state)
-			state = await self.agents["advisor"].execute(state)
-			state = await self.agents["explainer"].execute(state)
-			state = await self.agents["supervisor"].execute(state)
-			if emit:
-				await emit({"event": "complete", "data": {"phase": str(state["current_phase"])}})
-			return state
-		elif flow in ("quick_check",):
-			# analyzer -> forecaster -> alert_manager -> advisor -> explainer -> supervisor
-			state = await self.agents["analyzer"].execute(state)
-			if emit:
-				await emit({"event": "analysis", "data": {"phase": str(state["current_phase"])}})
-			state = await self.agents["forecaster"].execute(state)
-			if emit:
-				await emit({"event": "forecasting", "data": {"phase": str(state["current_phase"])}})
-			state = await self.agents["alert_manager"].execute(state)
-			state = await self.agents["advisor"].execute(state)
-			state = await self.agents["explainer"].execute(state)
-			state = await self.agents["supervisor"].execute(state)
-			if emit:
-				await emit({"event": "complete", "data": {"phase": str(state["current_phase"])}})
-			return state
+		stages = _FLOWS.get(flow, _DEFAULT_FLOW)
+		if stages[0][0] == "data_collector":
+			state = await self._run_stages(stages[:1], state, emit)
+			stages = stages[1:]
+
+		key = None
+		# Streaming callers expect every per-stage event, so they always run the stages
+		if self.cache is not None and emit is None:
+			key = make_key(flow, state.raw_data, state.parameters)
+			now_ns = time.time_ns()
+			if self.cache.load(key, state, now_ns):
+				state.messages.append({**ts_fields(now_ns), "agent": "pipeline_cache", "msg": "hit"})
+				return state
+
+		if self.fused and emit is None and flow in ("full_analysis", "quick_check"):
+			state = await process_core(state)
 		else:
-			# forecast / what_if minimal: forecaster -> explainer -> supervisor
-			state = await self.agents["forecaster"].execute(state)
-			if emit:
-				await emit({"event": "forecasting", "data": {"phase": str(state["current_phase"])}})
-			state = await self.agents["explainer"].execute(state)
-			state = await self.agents["supervisor"].execute(state)
-			if emit:
-				await emit({"event": "complete", "data": {"phase": str(state["current_phase"])}})
-			return state
+			state = await self._run_stages(stages, state, emit)
+		if key is not None:
+			self.cache.store(key, state)
+		return state
+
+	async def _run_stages(self, stages, state: AdvisoryState, emit=None) -> AdvisoryState:
+		# Sync agents are called inline; only I/O-bound ones go through await
+		for name, event in stages:
+			agent = self.agents[name]
+			state = agent.execute_sync(state) if agent.is_sync else await agent.execute(state)
+			if emit and event:
+				await emit({"event": event, "data": {"phase": str(state.current_phase)}})
+		return state
 
 	async def astream_events(self, initial_state: AdvisoryState) -> AsyncGenerator[Dict, None]:
-		queue = []
-		async def emit(evt):
-			queue.append(evt)
-		await self._run_pipeline(initial_state, emit=emit)
-		for evt in queue:
-			yield evt
+		# The pipeline runs as a producer task and keeps going while the consumer writes each event out
+		queue: asyncio.Queue = asyncio.Queue(maxsize=_STREAM_PREFETCH)
+		async def produce():
+			try:
+				await self._run_pipeline(initial_state, emit=queue.put)
+			except Exception as exc:
+				await queue.put(exc)
+				return
+			await queue.put(_STREAM_DONE)
+		task = asyncio.create_task(produce())
+		try:
+			while True:
+				evt = await queue.get()
+				if evt is _STREAM_DONE:
+					break
+				if isinstance(evt, Exception):
+					raise evt
+				yield evt
+		finally:
+			# Consumer gone (client disconnect) or pipeline finished; never leave the producer running
+			if not task.done():
+				task.cancel()
 
 	async def ainvoke(self, initial_state: AdvisoryState) -> AdvisoryState:
 		return await self._run_pipeline(initial_state)
@@ -0,0 +1,61 @@
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import blake2b
+from typing import Any, Dict
+import json
+from src.core.state import AdvisoryState, ts_fields
+
+# Bump when stage outputs change shape so stale entries stop matching
+SCHEMA_VERSION = 1
+
+# Everything the post-collection stages derive from raw_data + parameters
+_OUTPUT_FIELDS = (
+	"key_metrics",
+	"financial_health",
+	"cash_flow_forecast",
+	"pnl_forecast",
+	"alerts",
+	"recommendations",
+	"explanations",
+	"citations",
+	"confidence_scores",
+	"current_phase",
+)
+
+def make_key(flow: str, raw_data: Dict[str, Any], parameters: Dict[str, Any]) -> int:
+	blob = json.dumps([SCHEMA_VERSION, flow, raw_data, parameters], sort_keys=True, separators=(",", ":"), default=str)
+	return int.from_bytes(blake2b(blob.encode(), digest_size=8).digest(), "little")
+
+class PipelineCache:
+	"""LRU of pipeline outputs keyed on make_key(); the stages are pure in their inputs."""
+
+	def __init__(self, maxsize: int = 1024):
+		self.maxsize = maxsize
+		self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+	def load(self, key: int, state: AdvisoryState, now_ns: int) -> bool:
+		entry = self._entries.get(key)
+		if entry is None:
+			return False
+		self._entries.move_to_end(key)
+		for name, value in entry.items():
+			# Deep copies so a caller mutating nested alerts/forecasts never corrupts later hits
+			setattr(state, name, deepcopy(value))
+		# Replayed records are stamped with the hit time, not the time they were first computed
+		if state.financial_health is not None:
+			state.financial_health = state.financial_health.model_copy(update={"timestamp_ns": now_ns})
+		ts = ts_fields(now_ns)
+		for record in (*state.alerts, *state.recommendations):
+			record.update(ts)
+		return True
+
+	def store(self, key: int, state: AdvisoryState) -> None:
+		self._entries[key] = {name: deepcopy(getattr(state, name)) for name in _OUTPUT_FIELDS}
+		self._entries.move_to_end(key)
+		if len(self._entries) > self.maxsize:
+			self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		self._entries.clear()
+
+pipeline_cache = PipelineCache()
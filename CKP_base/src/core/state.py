@@ -1,8 +1,38 @@
 from __future__ import annotations
-from typing import TypedDict, List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional
 from enum import Enum
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import datetime, timedelta
+import os
+
+# Records carry an int "ts_ns"; set EMIT_ISO_TS=1 to also emit the legacy ISO "ts"
+EMIT_ISO_TS = os.getenv("EMIT_ISO_TS", "0") == "1"
+_EPOCH = datetime(1970, 1, 1)
+
+def format_ts(ns: int) -> str:
+	return (_EPOCH + timedelta(microseconds=ns // 1000)).isoformat()
+
+def ts_fields(ns: int) -> Dict[str, Any]:
+	fields: Dict[str, Any] = {"ts_ns": ns}
+	if EMIT_ISO_TS:
+		fields["ts"] = format_ts(ns)
+	return fields
+
+# (source, field) order of AdvisoryState.raw_vec; analyzer reads fixed offsets
+RAW_VEC_FIELDS = (
+	("erp", "revenue"),
+	("erp", "cogs"),
+	("accounting", "opex"),
+	("accounting", "interest"),
+	("bank", "cash"),
+	("bank", "current_assets"),
+	("bank", "current_liabilities"),
+	("bank", "short_term_debt"),
+)
+
+def raw_vector(raw_data: Dict[str, Any]) -> tuple:
+	return tuple(float(raw_data.get(src, {}).get(name, 0.0)) for src, name in RAW_VEC_FIELDS)
 
 class AnalysisPhase(str, Enum):
 	DATA_COLLECTION = "data_collection"
@@ -19,30 +49,33 @@ class FinancialHealth(BaseModel):
 	liquidity_health: float
 	debt_health: float
 	overall_score: float
-	timestamp: datetime
-
-class AdvisoryState(TypedDict, total=False):
-	request_id: str
-	user_id: str
-	company_id: str
-	request_type: str  # "full_analysis", "quick_check", "forecast", "what_if"
-	current_phase: AnalysisPhase
-	messages: List[Dict[str, Any]]
-	raw_data: Dict[str, Any]
-	data_sources: List[str]
-	last_sync_timestamp: Optional[datetime]
-	financial_health: FinancialHealth | None
-	key_metrics: Dict[str, Any]
-	trends: Dict[str, Any]
-	cash_flow_forecast: Optional[Dict[str, Any]]
-	pnl_forecast: Optional[Dict[str, Any]]
-	scenarios: List[Dict[str, Any]]
-	alerts: List[Dict[str, Any]]
-	recommendations: List[Dict[str, Any]]
-	action_items: List[Dict[str, Any]]
-	explanations: Dict[str, str]
-	citations: List[Dict[str, str]]
-	confidence_scores: Dict[str, float]
-	processing_time: float
-	token_usage: Dict[str, int]
-	errors: List[str]
+	timestamp_ns: int  # time.time_ns()
+
+@dataclass(slots=True)
+class AdvisoryState:
+	request_id: str = ""
+	user_id: str = ""
+	company_id: str = ""
+	request_type: str = "quick_check"  # "full_analysis", "quick_check", "forecast", "what_if"
+	current_phase: AnalysisPhase = AnalysisPhase.DATA_COLLECTION
+	parameters: Dict[str, Any] = field(default_factory=dict)
+	messages: List[Dict[str, Any]] = field(default_factory=list)
+	raw_data: Dict[str, Any] = field(default_factory=dict)
+	raw_vec: Optional[tuple] = None  # raw_vector(raw_data), coerced once at ingest
+	data_sources: List[str] = field(default_factory=list)
+	last_sync_timestamp: Optional[int] = None  # time.time_ns()
+	financial_health: FinancialHealth | None = None
+	key_metrics: Dict[str, Any] = field(default_factory=dict)
+	trends: Dict[str, Any] = field(default_factory=dict)
+	cash_flow_forecast: Optional[Dict[str, Any]] = None
+	pnl_forecast: Optional[Dict[str, Any]] = None
+	scenarios: List[Dict[str, Any]] = field(default_factory=list)
+	alerts: List[Dict[str, Any]] = field(default_factory=list)
+	recommendations: List[Dict[str, Any]] = field(default_factory=list)
+	action_items: List[Dict[str, Any]] = field(default_factory=list)
+	explanations: Dict[str, str] = field(default_factory=dict)
+	citations: List[Dict[str, str]] = field(default_factory=list)
+	confidence_scores: Dict[str, float] = field(default_factory=dict)
+	processing_time: float = 0.0
+	token_usage: Dict[str, int] = field(default_factory=dict)
+	errors: List[str] = field(default_factory=list)
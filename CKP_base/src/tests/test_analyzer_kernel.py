@@ -0,0 +1,40 @@
+"""Regression tests for the analyzer kernel and alert rules (run from CKP_base/)."""
+
+import asyncio
+
+from src.agents.analyzer_kernel import compute
+from src.agents.fused_core import process_core
+from src.core.state import AdvisoryState
+
+
+def test_current_ratio_is_exact_when_assets_equal_liabilities():
+	"""CA == CL must give exactly 1.0; a reciprocal product misses it for e.g. 49, 98, 103."""
+	for value in range(1, 1000):
+		current_ratio = compute(100.0, 50.0, 10.0, 1.0, 10.0, float(value), float(value), 0.0)[3]
+		assert current_ratio == 1.0, value
+
+
+def test_no_liquidity_alert_at_current_ratio_one():
+	"""A current ratio of exactly 1.0 is not below the liquidity threshold."""
+	raw_data = {
+		"erp": {"revenue": 1000.0, "cogs": 400.0},
+		"accounting": {"opex": 100.0, "interest": 10.0},
+		"bank": {"cash": 500.0, "current_assets": 49.0, "current_liabilities": 49.0, "short_term_debt": 0.0},
+	}
+	state = asyncio.run(process_core(AdvisoryState(request_type="quick_check", raw_data=raw_data)))
+
+	assert state.key_metrics["current_ratio"] == 1.0
+	assert all(alert["id"] != "liquidity_risk" for alert in state.alerts)
+
+
+def test_non_finite_inputs_complete_without_alerts():
+	"""nan / inf current ratios must not crash alert bucketing and, as plain comparisons, raise no liquidity alert."""
+	for current_assets, current_liabilities in (("nan", 10.0), (10.0, 1e-300)):
+		raw_data = {
+			"erp": {"revenue": 1000.0, "cogs": 400.0},
+			"accounting": {"opex": 100.0, "interest": 10.0},
+			"bank": {"cash": 500.0, "current_assets": current_assets, "current_liabilities": current_liabilities},
+		}
+		state = asyncio.run(process_core(AdvisoryState(request_type="quick_check", raw_data=raw_data)))
+
+		assert all(alert["id"] != "liquidity_risk" for alert in state.alerts)
@@ -29,7 +29,7 @@ AI CFO Agent sử dụng LangGraph workflow với 7 bước xử lý tuần tự
   - Tính toán các ratios và metrics
   - So sánh với benchmarks
   - Phân tích trends và patterns
-- **Output**: Analysis results trong metadata
+- **Output**: Analysis results trong `state.analysis_results`
 
 ### 4. generate_insights
 - **Mục đích**: Tạo insights và interpretations
@@ -38,7 +38,7 @@ AI CFO Agent sử dụng LangGraph workflow với 7 bước xử lý tuần tự
   - Interpret kết quả phân tích
   - Identify key findings
   - Generate actionable insights
-- **Output**: Insights trong metadata
+- **Output**: Insights trong `state.insights`
 
 ### 5. assess_risks
 - **Mục đích**: Đánh giá rủi ro tài chính
@@ -47,7 +47,7 @@ AI CFO Agent sử dụng LangGraph workflow với 7 bước xử lý tuần tự
   - Identify potential risks
   - Quantify risk levels
   - Assess impact và probability
-- **Output**: Risk assessment trong metadata
+- **Output**: Risk assessment trong `state.risk_assessment`
 
 ### 6. provide_recommendations
 - **Mục đích**: Đưa ra recommendations cụ thể
@@ -56,7 +56,7 @@ AI CFO Agent sử dụng LangGraph workflow với 7 bước xử lý tuần tự
   - Generate actionable recommendations
   - Prioritize based on impact
   - Create implementation plan
-- **Output**: Recommendations trong metadata
+- **Output**: Recommendations trong `state.recommendations`
 
 ### 7. format_response
 - **Mục đích**: Format final report
@@ -78,9 +78,8 @@ gather_data → financial_data
     ↓
 perform_analysis → analysis_results
     ↓
-generate_insights → insights
-    ↓
-assess_risks → risk_assessment
+generate_insights → insights   ┐ (chạy song song)
+assess_risks → risk_assessment ┘
     ↓
 provide_recommendations → recommendations
     ↓
@@ -128,14 +127,15 @@ result = await self.compiled_graph.ainvoke(
 """
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langgraph.graph import StateGraph, END
 from langgraph.graph.message import add_messages
 
-from ai_financial.core.base_agent import BaseAgent
+from ai_financial.core.base_agent import BaseAgent, format_ts
 from ai_financial.core.config import settings
 from ai_financial.core.logging import get_logger
 from ai_financial.models.agent_models import AgentContext, AgentState
@@ -143,6 +143,29 @@ from ai_financial.models.agent_models import AgentContext, AgentState
 logger = get_logger(__name__)
 
 
+class _MockLLM:
+    """Demo-mode LLM stand-in, defined once at import rather than per agent."""
+    
+    async def ainvoke(self, messages, **kwargs):
+        # Simulate LLM response based on message content
+        content = (messages[0].content if messages else "").lower()
+
+        if "analyze" in content:
+            return AIMessage(content='{"analysis_types": ["Financial Health Assessment"], "priority": "high", "data_requirements": ["balance_sheet", "income_statement"], "timeline": "1-2 days"}')
+        elif "gather" in content:
+            return AIMessage(content="Financial data gathered successfully: Balance Sheet, Income Statement, Cash Flow Statement")
+        elif "analyze" in content and "perform" in content:
+            return AIMessage(content="Analysis completed: Current Ratio: 2.1, Debt-to-Equity: 0.8, ROE: 15.2%")
+        elif "insights" in content:
+            return AIMessage(content="Key insights: Strong liquidity position, manageable debt levels, good profitability")
+        elif "risk" in content:
+            return AIMessage(content="Risk assessment: Low credit risk, moderate market risk, high operational efficiency")
+        elif "recommend" in content:
+            return AIMessage(content="Recommendations: 1) Optimize working capital, 2) Consider debt refinancing, 3) Invest in growth initiatives")
+        else:
+            return AIMessage(content="AI CFO analysis completed successfully.")
+
+
 class AICFOAgent(BaseAgent):
     """AI CFO Agent for industry-specific financial advisory and analysis."""
 
@@ -161,9 +184,6 @@ class AICFOAgent(BaseAgent):
         else:
             self.llm = self._get_mock_llm()
             logger.warning("OpenAI API key not configured - running in demo mode")
-        
-        # Build and compile the workflow graph
-        self.compiled_graph = self._build_graph().compile()
     
     def _get_llm(self):
         """Get real LLM instance."""
@@ -186,29 +206,7 @@ class AICFOAgent(BaseAgent):
     
     def _get_mock_llm(self):
         """Get mock LLM for demo mode."""
-        from langchain_core.messages import AIMessage
-        
-        class MockLLM:
-            async def ainvoke(self, messages, **kwargs):
-                # Simulate LLM response based on message content
-                content = messages[0].content if messages else ""
-                
-                if "analyze" in content.lower():
-                    return AIMessage(content='{"analysis_types": ["Financial Health Assessment"], "priority": "high", "data_requirements": ["balance_sheet", "income_statement"], "timeline": "1-2 days"}')
-                elif "gather" in content.lower():
-                    return AIMessage(content="Financial data gathered successfully: Balance Sheet, Income Statement, Cash Flow Statement")
-                elif "analyze" in content.lower() and "perform" in content.lower():
-                    return AIMessage(content="Analysis completed: Current Ratio: 2.1, Debt-to-Equity: 0.8, ROE: 15.2%")
-                elif "insights" in content.lower():
-                    return AIMessage(content="Key insights: Strong liquidity position, manageable debt levels, good profitability")
-                elif "risk" in content.lower():
-                    return AIMessage(content="Risk assessment: Low credit risk, moderate market risk, high operational efficiency")
-                elif "recommend" in content.lower():
-                    return AIMessage(content="Recommendations: 1) Optimize working capital, 2) Consider debt refinancing, 3) Invest in growth initiatives")
-                else:
-                    return AIMessage(content="AI CFO analysis completed successfully.")
-        
-        return MockLLM()
+        return _MockLLM()
     
     def _build_graph(self) -> StateGraph:
         """Build the LangGraph workflow."""
@@ -218,8 +216,7 @@ class AICFOAgent(BaseAgent):
         graph.add_node("analyze_request", self._analyze_request)
         graph.add_node("gather_data", self._gather_financial_data)
         graph.add_node("perform_analysis", self._perform_financial_analysis)
-        graph.add_node("generate_insights", self._generate_insights)
-        graph.add_node("assess_risks", self._assess_risks)
+        graph.add_node("insights_and_risks", self._insights_and_risks)
         graph.add_node("provide_recommendations", self._provide_recommendations)
         graph.add_node("format_response", self._format_response)
         
@@ -227,9 +224,8 @@ class AICFOAgent(BaseAgent):
         graph.set_entry_point("analyze_request")  # ← This is the missing entrypoint!
         graph.add_edge("analyze_request", "gather_data")
         graph.add_edge("gather_data", "perform_analysis")
-        graph.add_edge("perform_analysis", "generate_insights")
-        graph.add_edge("generate_insights", "assess_risks")
-        graph.add_edge("assess_risks", "provide_recommendations")
+        graph.add_edge("perform_analysis", "insights_and_risks")
+        graph.add_edge("insights_and_risks", "provide_recommendations")
         graph.add_edge("provide_recommendations", "format_response")
         graph.add_edge("format_response", END)
         
@@ -266,14 +262,14 @@ Respond with a JSON object containing:
 - timeline: expected analysis timeline
 """
             
-            response = await self.llm.ainvoke([HumanMessage(content=analysis_prompt)])
+            response = await self._cached_ainvoke([HumanMessage(content=analysis_prompt)])
             classification = response.content if hasattr(response, 'content') else str(response)
             
             # Update metadata
             state.metadata["analysis_plan"] = {
                 "request": user_message,
                 "classification": classification,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("analyze_request")
@@ -309,7 +305,7 @@ Respond with a JSON object containing:
             state.metadata["financial_data"] = {
                 "data_summary": data_summary,
                 "sources": ["balance_sheet", "income_statement", "cash_flow"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("gather_data")
@@ -342,10 +338,10 @@ Respond with a JSON object containing:
             analysis_results = response.content if hasattr(response, 'content') else str(response)
             
             # Update metadata
-            state.metadata["analysis_results"] = {
+            state.analysis_results = {
                 "results": analysis_results,
                 "ratios_calculated": ["current_ratio", "debt_to_equity", "roe", "roa"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("perform_analysis")
@@ -359,6 +355,21 @@ Respond with a JSON object containing:
             state.error = str(e)
             return state
     
+    async def _insights_and_risks(self, state: AgentState) -> AgentState:
+        """Generate insights and assess risks concurrently.
+        
+        Neither prompt reads the other's output, so both LLM round-trips
+        overlap instead of running back to back. Each step writes its own
+        field on the shared state.
+        """
+        logger.info("🔀 Generating insights and assessing risks in parallel...")
+        await asyncio.gather(
+            self._generate_insights(state),
+            self._assess_risks(state),
+        )
+        state.current_step = "provide_recommendations"
+        return state
+    
     async def _generate_insights(self, state: AgentState) -> AgentState:
         """Generate insights from analysis results."""
         try:
@@ -373,15 +384,15 @@ Respond with a JSON object containing:
             - What are the key performance indicators showing?
             """
             
-            response = await self.llm.ainvoke([HumanMessage(content=insights_prompt)])
+            response = await self._cached_ainvoke([HumanMessage(content=insights_prompt)])
             insights = response.content if hasattr(response, 'content') else str(response)
             
             # Update metadata
-            state.metadata["insights"] = {
+            state.insights = {
                 "key_insights": insights,
                 "strengths": ["Strong liquidity", "Good profitability"],
                 "weaknesses": ["High debt levels", "Slow growth"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("generate_insights")
@@ -411,14 +422,14 @@ Respond with a JSON object containing:
             Provide risk levels (Low/Medium/High) and mitigation strategies.
             """
             
-            response = await self.llm.ainvoke([HumanMessage(content=risk_prompt)])
+            response = await self._cached_ainvoke([HumanMessage(content=risk_prompt)])
             risk_assessment = response.content if hasattr(response, 'content') else str(response)
             
             # Update metadata
-            state.metadata["risk_assessment"] = {
+            state.risk_assessment = {
                 "assessment": risk_assessment,
                 "risk_levels": {"credit": "Low", "market": "Medium", "operational": "Low"},
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("assess_risks")
@@ -450,11 +461,11 @@ Respond with a JSON object containing:
             recommendations = response.content if hasattr(response, 'content') else str(response)
             
             # Update metadata
-            state.metadata["recommendations"] = {
+            state.recommendations = {
                 "recommendations": recommendations,
                 "priorities": ["High", "Medium", "Low"],
                 "timeline": ["1-3 months", "3-12 months", "1-3 years"],
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("provide_recommendations")
@@ -485,19 +496,19 @@ Respond with a JSON object containing:
 {state.metadata.get('financial_data', {}).get('data_summary', 'Financial data summary')}
 
 ## Analysis Results
-{state.metadata.get('analysis_results', {}).get('results', 'Analysis results')}
+{state.analysis_results.get('results', 'Analysis results')}
 
 ## Key Insights
-{state.metadata.get('insights', {}).get('key_insights', 'Key insights')}
+{state.insights.get('key_insights', 'Key insights')}
 
 ## Risk Assessment
-{state.metadata.get('risk_assessment', {}).get('assessment', 'Risk assessment')}
+{state.risk_assessment.get('assessment', 'Risk assessment')}
 
 ## Recommendations
-{state.metadata.get('recommendations', {}).get('recommendations', 'Recommendations')}
+{state.recommendations.get('recommendations', 'Recommendations')}
 
 ---
-*Report generated by AI CFO Agent on {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')}*
+*Report generated by AI CFO Agent on {format_ts(time.time_ns())}*
 """
             
             # Add final message
@@ -508,7 +519,7 @@ Respond with a JSON object containing:
             state.metadata["final_report"] = {
                 "report": report,
                 "format": "markdown",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp_ns": time.time_ns()
             }
             
             state.completed_steps.append("format_response")
@@ -26,6 +26,22 @@ from ai_financial.models.agent_models import AgentContext, AgentState
 logger = get_logger(__name__)
 
 
+class _MockLLM:
+    """Demo-mode LLM stand-in, defined once at import rather than per agent."""
+    
+    async def ainvoke(self, messages, **kwargs):
+        content = (messages[0].content if messages else "").lower()
+
+        if "ratio" in content:
+            return AIMessage(content="Financial Ratios: Current Ratio: 2.1, Quick Ratio: 1.8, Debt-to-Equity: 0.65, ROE: 15.2%, ROA: 8.7%")
+        elif "trend" in content:
+            return AIMessage(content="Trend Analysis: Revenue growth 12% YoY, Profit margin improving, Cash flow positive and growing")
+        elif "benchmark" in content:
+            return AIMessage(content="Industry Benchmarking: Above average liquidity, competitive profitability, strong operational efficiency")
+        else:
+            return AIMessage(content="Comprehensive financial analysis completed with detailed metrics and insights.")
+
+
 class FinancialAnalyst(BaseAgent):
     """Financial Analyst - Specialized Worker Agent
     
@@ -60,9 +76,6 @@ class FinancialAnalyst(BaseAgent):
         else:
             self.llm = self._get_mock_llm()
             logger.warning("OpenAI API key not configured - running in demo mode")
-        
-        # Build and compile the workflow graph
-        self.compiled_graph = self._build_graph().compile()
     
     def _get_llm(self):
         """Get real LLM instance."""
@@ -76,23 +89,10 @@ class FinancialAnalyst(BaseAgent):
     
     def _get_mock_llm(self):
         """Get mock LLM for demo mode."""
-        class MockLLM:
-            async def ainvoke(self, messages, **kwargs):
-                content = messages[0].content if messages else ""
-                
-                if "ratio" in content.lower():
-                    return AIMessage(content="Financial Ratios: Current Ratio: 2.1, Quick Ratio: 1.8, Debt-to-Equity: 0.65, ROE: 15.2%, ROA: 8.7%")
-                elif "trend" in content.lower():
-                    return AIMessage(content="Trend Analysis: Revenue growth 12% YoY, Profit margin improving, Cash flow positive and growing")
-                elif "benchmark" in content.lower():
-                    return AIMessage(content="Industry Benchmarking: Above average liquidity, competitive profitability, strong operational efficiency")
-                else:
-                    return AIMessage(content="Comprehensive financial analysis completed with detailed metrics and insights.")
-        
-        return MockLLM()
+        return _MockLLM()
     
-    def get_system_prompt(self) -> str:
-        """Get specialized system prompt for financial analyst."""
+    def _compute_system_prompt(self) -> str:
+        """Build specialized system prompt for financial analyst."""
         return f"""You are a Financial Analyst Agent, a specialized expert in financial analysis within a multi-agent system.
 
 Your specialized capabilities:
@@ -123,18 +123,14 @@ Current context: You are operating as a specialist within a secure financial mul
         
         # Add nodes
         graph.add_node("analyze_task", self._analyze_task)
-        graph.add_node("calculate_ratios", self._calculate_ratios)
-        graph.add_node("perform_benchmarking", self._perform_benchmarking)
-        graph.add_node("analyze_trends", self._analyze_trends)
+        graph.add_node("run_analyses", self._run_analyses)
         graph.add_node("assess_financial_health", self._assess_financial_health)
         graph.add_node("format_analysis", self._format_analysis)
         
         # Define workflow edges
         graph.set_entry_point("analyze_task")
-        graph.add_edge("analyze_task", "calculate_ratios")
-        graph.add_edge("calculate_ratios", "perform_benchmarking")
-        graph.add_edge("perform_benchmarking", "analyze_trends")
-        graph.add_edge("analyze_trends", "assess_financial_health")
+        graph.add_edge("analyze_task", "run_analyses")
+        graph.add_edge("run_analyses", "assess_financial_health")
         graph.add_edge("assess_financial_health", "format_analysis")
         graph.add_edge("format_analysis", END)
         
@@ -182,6 +178,22 @@ Current context: You are operating as a specialist within a secure financial mul
             state.error = str(e)
             return state
     
+    async def _run_analyses(self, state: AgentState) -> AgentState:
+        """Run ratio, benchmarking and trend analyses concurrently.
+        
+        The three prompts are independent (only the health assessment reads
+        their results), so the LLM round-trips overlap instead of queuing.
+        Each step writes its own metadata key on the shared state.
+        """
+        logger.info("🔀 Running ratio, benchmarking and trend analyses in parallel...")
+        await asyncio.gather(
+            self._calculate_ratios(state),
+            self._perform_benchmarking(state),
+            self._analyze_trends(state),
+        )
+        state.current_step = "assess_financial_health"
+        return state
+    
     async def _calculate_ratios(self, state: AgentState) -> AgentState:
         """Calculate comprehensive financial ratios."""
         try:
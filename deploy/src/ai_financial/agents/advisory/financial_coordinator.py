@@ -25,6 +25,20 @@ from ai_financial.models.agent_models import AgentContext, AgentState
 logger = get_logger(__name__)
 
 
+class _MockLLM:
+    """Demo-mode LLM stand-in, defined once at import rather than per agent."""
+    
+    async def ainvoke(self, messages, **kwargs):
+        content = (messages[0].content if messages else "").lower()
+
+        if "route" in content:
+            return AIMessage(content='{"primary_agent": "financial_analyst", "supporting_agents": ["risk_assessor"], "workflow_type": "sequential"}')
+        elif "synthesize" in content:
+            return AIMessage(content="Comprehensive financial analysis completed with risk assessment and strategic recommendations.")
+        else:
+            return AIMessage(content="Financial coordination completed successfully.")
+
+
 class FinancialCoordinator(BaseAgent):
     """Financial Coordinator Agent - Hierarchical Multi-Agent Pattern
     
@@ -57,9 +71,6 @@ class FinancialCoordinator(BaseAgent):
             "strategic_advisor": None,
             "compliance_checker": None
         }
-        
-        # Build and compile the workflow graph
-        self.compiled_graph = self._build_graph().compile()
     
     def _get_llm(self):
         """Get real LLM instance."""
@@ -73,18 +84,7 @@ class FinancialCoordinator(BaseAgent):
     
     def _get_mock_llm(self):
         """Get mock LLM for demo mode."""
-        class MockLLM:
-            async def ainvoke(self, messages, **kwargs):
-                content = messages[0].content if messages else ""
-                
-                if "route" in content.lower():
-                    return AIMessage(content='{"primary_agent": "financial_analyst", "supporting_agents": ["risk_assessor"], "workflow_type": "sequential"}')
-                elif "synthesize" in content.lower():
-                    return AIMessage(content="Comprehensive financial analysis completed with risk assessment and strategic recommendations.")
-                else:
-                    return AIMessage(content="Financial coordination completed successfully.")
-        
-        return MockLLM()
+        return _MockLLM()
     
     def _build_graph(self) -> StateGraph:
         """Build the coordinator workflow graph."""
@@ -1,8 +1,12 @@
 """Base agent class with LangChain/LangGraph integration."""
 
 import asyncio
+import hashlib
+import json
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union
 from uuid import uuid4
 
 from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
@@ -19,6 +23,35 @@ T = TypeVar('T', bound=BaseModel)
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
+# Typed AgentState result fields, folded back into the response metadata
+_RESULT_FIELDS = ("analysis_results", "insights", "risk_assessment", "recommendations")
+
+_BASE_CAPABILITIES: Tuple[str, ...] = (
+    "natural_language_processing",
+    "financial_data_analysis",
+    "workflow_execution",
+    "error_handling",
+    "audit_logging",
+)
+
+
+def format_ts(ns: int) -> str:
+    """Format a ``time.time_ns()`` value as an ISO-8601 UTC string."""
+    return datetime.fromtimestamp(ns / 1e9, tz=timezone.utc).isoformat()
+
+
+def _with_iso_timestamps(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Add an ISO ``timestamp`` next to each ``timestamp_ns`` entry.
+    
+    Nodes record raw nanosecond ints; the string form is only built here,
+    once per response.
+    """
+    return {
+        key: {**value, "timestamp": format_ts(value["timestamp_ns"])}
+        if isinstance(value, dict) and "timestamp_ns" in value else value
+        for key, value in metadata.items()
+    }
+
 
 class BaseAgent(ABC):
     """Base class for all AI agents in the financial system."""
@@ -91,6 +124,9 @@ class BaseAgent(ABC):
         
         # Agent state
         self._context: Optional[AgentContext] = None
+        self._system_prompt: Optional[str] = None
+        self._system_message: Optional[SystemMessage] = None
+        self._llm_cache: "OrderedDict[str, Any]" = OrderedDict()
         
         logger.info(
             "Agent initialized",
@@ -123,6 +159,29 @@ class BaseAgent(ABC):
     def get_system_prompt(self) -> str:
         """Get the system prompt for this agent.
         
+        The prompt only depends on attributes fixed at construction, so it is
+        built on first use and reused for every later request.
+        
+        Returns:
+            System prompt string
+        """
+        if self._system_prompt is None:
+            self._system_prompt = self._compute_system_prompt()
+        return self._system_prompt
+    
+    def _get_system_message(self) -> SystemMessage:
+        """Get the system message shared by every request to this agent.
+        
+        Returns:
+            SystemMessage wrapping the cached system prompt
+        """
+        if self._system_message is None:
+            self._system_message = SystemMessage(content=self.get_system_prompt())
+        return self._system_message
+    
+    def _compute_system_prompt(self) -> str:
+        """Build the system prompt for this agent.
+        
         Returns:
             System prompt string
         """
@@ -137,6 +196,32 @@ When uncertain, ask for clarification or escalate to human oversight.
 Current context: You are operating within a secure financial system with proper audit trails.
 """
     
+    async def _cached_ainvoke(self, messages: List[BaseMessage]) -> Any:
+        """Invoke the LLM, reusing the response for an identical prompt.
+        
+        Responses are kept in a per-agent LRU keyed on a SHA-256 of the model
+        name and the message types/contents. Only use this for deterministic
+        prompts whose answer does not depend on call time.
+        
+        Args:
+            messages: Messages to send to the LLM
+            
+        Returns:
+            The LLM response (possibly cached)
+        """
+        payload = [getattr(self.llm, "model_name", ""), [(m.type, m.content) for m in messages]]
+        key = hashlib.sha256(json.dumps(payload, default=str).encode()).hexdigest()
+        cached = self._llm_cache.get(key)
+        if cached is not None:
+            self._llm_cache.move_to_end(key)
+            return cached
+        
+        response = await self.llm.ainvoke(messages)
+        self._llm_cache[key] = response
+        if len(self._llm_cache) > settings.llm.llm_cache_size:
+            self._llm_cache.popitem(last=False)
+        return response
+    
     async def invoke(
         self,
         request: Union[str, Dict[str, Any], BaseMessage],
@@ -271,7 +356,7 @@ Current context: You are operating within a secure financial system with proper
         messages = []
         
         # Add system message
-        messages.append(SystemMessage(content=self.get_system_prompt()))
+        messages.append(self._get_system_message())
         
         # Add user message
         if isinstance(request, str):
@@ -302,11 +387,13 @@ Current context: You are operating within a secure financial system with proper
         """
         # Handle both AgentState and dict results
         if isinstance(result, dict):
+            metadata = result.get("metadata", {})
+            typed = {name: result[name] for name in _RESULT_FIELDS if result.get(name)}
             return {
                 "agent_id": self.agent_id,
                 "session_id": result.get("session_id"),
                 "response": result.get("response", "No response generated"),
-                "metadata": result.get("metadata", {}),
+                "metadata": _with_iso_timestamps({**metadata, **typed}),
                 "completed_steps": result.get("completed_steps", []),
                 "error": result.get("error"),
             }
@@ -316,11 +403,14 @@ Current context: You are operating within a secure financial system with proper
         ai_messages = [msg for msg in messages if hasattr(msg, 'content') and getattr(msg, '__class__', None) and getattr(msg.__class__, '__name__', '') == 'AIMessage']
         last_message = ai_messages[-1] if ai_messages else None
         
+        metadata = getattr(result, 'metadata', {})
+        typed = {name: getattr(result, name) for name in _RESULT_FIELDS if getattr(result, name, None)}
+        
         return {
             "agent_id": self.agent_id,
             "session_id": getattr(getattr(result, 'context', None), 'session_id', None),
             "response": getattr(last_message, 'content', "No response generated") if last_message else "No response generated",
-            "metadata": getattr(result, 'metadata', {}),
+            "metadata": _with_iso_timestamps({**metadata, **typed}),
             "completed_steps": getattr(result, 'completed_steps', []),
             "error": getattr(result, 'error', None),
         }
@@ -360,19 +450,13 @@ Current context: You are operating within a secure financial system with proper
         # For now, this is a no-op as state is managed during execution
         pass
     
-    def get_capabilities(self) -> List[str]:
+    def get_capabilities(self) -> Tuple[str, ...]:
         """Get the capabilities of this agent.
         
         Returns:
-            List of capability names
+            Immutable tuple of capability names
         """
-        return [
-            "natural_language_processing",
-            "financial_data_analysis",
-            "workflow_execution",
-            "error_handling",
-            "audit_logging",
-        ]
+        return _BASE_CAPABILITIES
     
     def get_metadata(self) -> Dict[str, Any]:
         """Get agent metadata.
@@ -411,12 +495,13 @@ class SimpleAgent(BaseAgent):
         with tracer.start_as_current_span(f"{self.agent_id}.process_request"):
             try:
                 # Get the last human message
-                human_messages = [msg for msg in state.messages if isinstance(msg, HumanMessage)]
-                if not human_messages:
+                last_human_message = next(
+                    (msg for msg in reversed(state.messages) if isinstance(msg, HumanMessage)),
+                    None,
+                )
+                if last_human_message is None:
                     raise ValueError("No human message found in state")
                 
-                last_human_message = human_messages[-1]
-                
                 # Process with LLM
                 if settings.llm.has_openai_key:
                     response = await self.llm.ainvoke(state.messages)
@@ -27,6 +27,9 @@ class DatabaseSettings(BaseSettings):
     postgres_user: str = Field(default="ai_financial", env="POSTGRES_USER")
     postgres_password: str = Field(default="", env="POSTGRES_PASSWORD")
     postgres_db: str = Field(default="ai_financial", env="POSTGRES_DB")
+    pool_size: int = Field(default=20, env="DB_POOL_SIZE")
+    max_overflow: int = Field(default=40, env="DB_MAX_OVERFLOW")
+    pool_recycle: int = Field(default=1800, env="DB_POOL_RECYCLE")  # seconds
     
     # MongoDB settings
     mongodb_url: str = Field(default="mongodb://localhost:27017", env="MONGODB_URL")
@@ -35,6 +38,7 @@ class DatabaseSettings(BaseSettings):
     # Redis settings
     redis_url: str = Field(default="redis://localhost:6379", env="REDIS_URL")
     redis_db: int = Field(default=0, env="REDIS_DB")
+    redis_max_connections: int = Field(default=64, env="REDIS_MAX_CONNECTIONS")
     
     @property
     def postgres_url(self) -> str:
@@ -49,6 +53,7 @@ class LLMSettings(BaseSettings):
     openai_model: str = Field(default="gpt-4-turbo-preview", env="OPENAI_MODEL")
     openai_temperature: float = Field(default=0.1, env="OPENAI_TEMPERATURE")
     openai_max_tokens: int = Field(default=4000, env="OPENAI_MAX_TOKENS")
+    llm_cache_size: int = Field(default=1024, env="LLM_CACHE_SIZE")
     
     # Langfuse settings for monitoring
     langfuse_secret_key: str = Field(default="", env="LANGFUSE_SECRET_KEY")
@@ -97,6 +102,7 @@ class MonitoringSettings(BaseSettings):
     otel_service_name: str = Field(default="ai-financial-system", env="OTEL_SERVICE_NAME")
     otel_exporter_otlp_endpoint: str = Field(default="", env="OTEL_EXPORTER_OTLP_ENDPOINT")
     otel_exporter_otlp_headers: str = Field(default="", env="OTEL_EXPORTER_OTLP_HEADERS")
+    otel_tracing_enabled: bool = Field(default=True, env="OTEL_TRACING_ENABLED")
     
     # Logging settings
     log_level: str = Field(default="INFO", env="LOG_LEVEL")
@@ -105,6 +111,7 @@ class MonitoringSettings(BaseSettings):
     # Metrics settings
     enable_metrics: bool = Field(default=True, env="ENABLE_METRICS")
     metrics_port: int = Field(default=8000, env="METRICS_PORT")
+    metrics_scrape_interval: float = Field(default=15.0, env="METRICS_SCRAPE_INTERVAL")
 
 
 class MCPSettings(BaseSettings):
@@ -113,6 +120,7 @@ class MCPSettings(BaseSettings):
     mcp_server_host: str = Field(default="localhost", env="MCP_SERVER_HOST")
     mcp_server_port: int = Field(default=8001, env="MCP_SERVER_PORT")
     mcp_tool_timeout: int = Field(default=30, env="MCP_TOOL_TIMEOUT")
+    max_compute_tool_concurrency: int = Field(default=8, env="MCP_MAX_COMPUTE_TOOL_CONCURRENCY")
     
     # Tool configuration
     enabled_tools: List[str] = Field(default_factory=lambda: [
@@ -155,6 +163,11 @@ class WorkflowSettings(BaseSettings):
     # Processing settings
     batch_size: int = Field(default=100, env="BATCH_SIZE")
     max_concurrent_agents: int = Field(default=10, env="MAX_CONCURRENT_AGENTS")
+    max_parallel_steps_per_agent: int = Field(default=8, env="MAX_PARALLEL_STEPS_PER_AGENT")
+    
+    # Agent step result cache
+    step_cache_size: int = Field(default=1024, env="WORKFLOW_STEP_CACHE_SIZE")
+    step_cache_ttl_seconds: float = Field(default=300.0, env="WORKFLOW_STEP_CACHE_TTL_SECONDS")
 
 
 class Settings(BaseSettings):
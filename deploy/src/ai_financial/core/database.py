@@ -2,57 +2,125 @@
 Database configuration and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
-from typing import Generator
-import redis
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.base import ExecutableOption
+from typing import Any, AsyncIterator, Dict, Sequence, Tuple, Type
+import os
+import time
+import uuid
+import orjson
+import redis.asyncio as aioredis
 from .config import settings
 
-# SQLAlchemy setup
-engine = create_engine(
-    settings.database_url,
-    poolclass=StaticPool,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
-    echo=settings.debug
+
+def _json_dumps(value: Any) -> str:
+    """
+    Encode JSON/JSONB column values with orjson (int dict keys coerced like stdlib json)
+    """
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary keys
+
+    The leading 48-bit millisecond timestamp keeps new keys on the rightmost
+    B-tree leaf instead of scattering inserts across the index like uuid4.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                          # version
+        | (rand >> 62 & 0xFFF) << 64         # rand_a
+        | 0b10 << 62                         # variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+# SQLAlchemy setup: pooled async engine so request handlers overlap on DB I/O
+engine = create_async_engine(
+    settings.database.postgres_url,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.database.pool_size,
+    max_overflow=settings.database.max_overflow,
+    pool_recycle=settings.database.pool_recycle,
+    pool_pre_ping=True,
+    echo=settings.debug,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 Base = declarative_base()
 
-# Redis setup
-redis_client = redis.from_url(settings.redis_url, decode_responses=True)
+# Redis setup: asyncio client so handlers yield to the loop during Redis round-trips
+redis_client = aioredis.from_url(
+    settings.database.redis_url,
+    decode_responses=True,
+    max_connections=settings.database.redis_max_connections,
+    health_check_interval=30,
+    socket_keepalive=True,
+)
 
 
-def get_db() -> Generator[Session, None, None]:
+async def get_db() -> AsyncIterator[AsyncSession]:
     """
     Dependency to get database session
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def get_redis() -> redis.Redis:
+def loader_options(*options: ExecutableOption) -> Tuple[ExecutableOption, ...]:
+    """
+    Loader options for a query, with unplanned lazy loads raising outside production
+
+    Pass the eager loads the caller relies on, e.g.
+    ``select(WorkflowState).options(*loader_options(selectinload(WorkflowState.approval_requests)))``;
+    touching any other relationship then raises instead of silently issuing N+1 SELECTs.
+    """
+    if settings.is_production():
+        return options
+    return (*options, raiseload("*"))
+
+
+async def bulk_insert(session: AsyncSession, model: Type[Any], rows: Sequence[Dict[str, Any]]) -> None:
+    """
+    Insert many rows of ``model`` (e.g. AgentExecution or SyncLog) in one executemany
+
+    Column defaults are applied per row and the statement is sent as batched
+    multi-row INSERTs rather than one round trip per ``session.add``. Every row
+    must carry the same keys.
+    """
+    if rows:
+        await session.execute(insert(model), rows)
+
+
+def get_redis() -> aioredis.Redis:
     """
-    Get Redis client instance
+    Get Redis client instance (await its commands)
     """
     return redis_client
 
 
-def create_tables():
+async def create_tables():
     """
     Create all database tables
     """
-    Base.metadata.create_all(bind=engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
 
 
-def drop_tables():
+async def drop_tables():
     """
     Drop all database tables
     """
-    Base.metadata.drop_all(bind=engine)
\ No newline at end of file
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
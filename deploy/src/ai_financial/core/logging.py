@@ -2,7 +2,8 @@
 
 import logging
 import sys
-from typing import Any, Dict
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict
 
 import structlog
 from opentelemetry import trace
@@ -20,6 +21,9 @@ except ImportError:
 
 from ai_financial.core.config import settings
 
+# Whether spans go anywhere; set by setup_tracing() and read by maybe_span()
+_tracing_enabled = False
+
 
 def setup_logging() -> None:
     """Set up structured logging with OpenTelemetry integration."""
@@ -57,9 +61,15 @@ def setup_logging() -> None:
 
 def setup_tracing() -> None:
     """Set up OpenTelemetry tracing."""
+    global _tracing_enabled
+    
+    if not settings.monitoring.otel_tracing_enabled:
+        _tracing_enabled = False
+        return
     
     # Check if tracer provider is already set to avoid override
     if trace.get_tracer_provider() is not None and hasattr(trace.get_tracer_provider(), '_resource'):
+        _tracing_enabled = True
         return
     
     # Create resource
@@ -83,12 +93,14 @@ def setup_tracing() -> None:
         # Add span processor
         span_processor = BatchSpanProcessor(otlp_exporter)
         tracer_provider.add_span_processor(span_processor)
+        _tracing_enabled = True
     else:
         # In development, use console exporter to see traces in logs
         if settings.is_development():
             console_exporter = ConsoleSpanExporter()
             console_processor = SimpleSpanProcessor(console_exporter)
             tracer_provider.add_span_processor(console_processor)
+            _tracing_enabled = True
     
     # Instrument logging if available
     if LOGGING_INSTRUMENTATION_AVAILABLE:
@@ -123,6 +135,17 @@ def get_tracer(name: str) -> trace.Tracer:
     return trace.get_tracer(name)
 
 
+def maybe_span(tracer: trace.Tracer, name: str) -> ContextManager[trace.Span]:
+    """Start ``name`` as the current span, or do nothing when no exporter is set up.
+    
+    With tracing off this yields the shared non-recording ``INVALID_SPAN``, so
+    ``span.set_attribute`` calls stay valid without allocating a span.
+    """
+    if _tracing_enabled:
+        return tracer.start_as_current_span(name)
+    return nullcontext(trace.INVALID_SPAN)
+
+
 # Initialize logging and tracing
 setup_logging()
 setup_tracing()
@@ -1,11 +1,13 @@
 """Tool Hub for managing MCP tools and servers."""
 
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 import asyncio
+import time
+from collections import Counter
 from datetime import datetime
 
 from ai_financial.core.config import settings
-from ai_financial.core.logging import get_logger, get_tracer
+from ai_financial.core.logging import get_logger, get_tracer, maybe_span
 from ai_financial.mcp.server import MCPServer, MCPToolDefinition
 from ai_financial.mcp.tools.base_tool import BaseTool, ToolResult
 
@@ -13,6 +15,15 @@ logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
 
+# Compute-style tool categories that share a bounded execution pool; others dispatch directly
+_BOUNDED_CATEGORIES = frozenset({"calculation", "financial_analysis"})
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Return the set of 3-character substrings of ``text``."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
 class ToolHub:
     """Central hub for managing MCP tools and servers."""
     
@@ -20,6 +31,28 @@ class ToolHub:
         """Initialize the Tool Hub."""
         self.servers: Dict[str, MCPServer] = {}
         self.tool_registry: Dict[str, str] = {}  # tool_name -> server_id mapping
+        # tool_name -> owning server, resolved at registration so dispatch is one lookup
+        self._tool_servers: Dict[str, MCPServer] = {}
+        # server_id -> names of its tools, so unregistering a server skips the registry scan
+        self._server_tools: Dict[str, Set[str]] = {}
+        # tool_name -> category, and live tools per category, for get_hub_status
+        self._tool_categories: Dict[str, str] = {}
+        self._category_counts: Counter = Counter()
+        # Caps concurrent compute-style tool executions
+        self._compute_slots = asyncio.Semaphore(settings.mcp.max_compute_tool_concurrency)
+        
+        # Listing caches, rebuilt lazily when _generation moves past _cache_generation
+        self._generation = 0
+        self._cache_generation = -1
+        self._cached_tools: List[MCPToolDefinition] = []
+        self._cached_by_category: Dict[str, List[MCPToolDefinition]] = {}
+        # Search index over _cached_tools positions: lowercased (name, description) and trigram postings
+        self._search_text: List[Tuple[str, str]] = []
+        self._trigram_index: Dict[str, Set[int]] = {}
+        # get_hub_metrics() snapshot, reused for one scrape interval within a generation
+        self._metrics_cache: Optional[Dict[str, Any]] = None
+        self._metrics_expires_at = 0.0
+        self._metrics_generation = -1
         
         # Initialize default server
         self.default_server = MCPServer(
@@ -44,7 +77,7 @@ class ToolHub:
         Args:
             server: MCP server to register
         """
-        with tracer.start_as_current_span("tool_hub.register_server"):
+        with maybe_span(tracer, "tool_hub.register_server"):
             server_id = server.server_id
             
             if server_id in self.servers:
@@ -57,7 +90,8 @@ class ToolHub:
             
             # Update tool registry
             for tool_name in server._tools.keys():
-                self.tool_registry[tool_name] = server_id
+                self._map_tool(tool_name, server)
+            self._generation += 1
             
             logger.info(
                 "Server registered",
@@ -75,22 +109,15 @@ class ToolHub:
         Returns:
             True if server was unregistered, False if not found
         """
-        if server_id not in self.servers:
+        if self.servers.pop(server_id, None) is None:
             return False
         
-        server = self.servers[server_id]
-        
         # Remove tools from registry
-        tools_to_remove = [
-            tool_name for tool_name, sid in self.tool_registry.items()
-            if sid == server_id
-        ]
+        tools_to_remove = self._server_tools.pop(server_id, set())
         
         for tool_name in tools_to_remove:
-            del self.tool_registry[tool_name]
-        
-        # Remove server
-        del self.servers[server_id]
+            self._unmap_tool(tool_name)
+        self._generation += 1
         
         logger.info(
             "Server unregistered",
@@ -111,7 +138,7 @@ class ToolHub:
             tool: Tool to register
             server_id: Server ID (defaults to 'default')
         """
-        with tracer.start_as_current_span("tool_hub.register_tool"):
+        with maybe_span(tracer, "tool_hub.register_tool"):
             server_id = server_id or "default"
             
             if server_id not in self.servers:
@@ -122,7 +149,8 @@ class ToolHub:
             
             # Update tool registry
             tool_name = tool.get_name()
-            self.tool_registry[tool_name] = server_id
+            self._map_tool(tool_name, server)
+            self._generation += 1
             
             logger.info(
                 "Tool registered with hub",
@@ -140,16 +168,17 @@ class ToolHub:
         Returns:
             True if tool was unregistered, False if not found
         """
-        if tool_name not in self.tool_registry:
+        server_id = self.tool_registry.get(tool_name)
+        if server_id is None:
             return False
         
-        server_id = self.tool_registry[tool_name]
         server = self.servers[server_id]
         
         success = server.unregister_tool(tool_name)
         
         if success:
-            del self.tool_registry[tool_name]
+            self._unmap_tool(tool_name)
+            self._generation += 1
             
             logger.info(
                 "Tool unregistered from hub",
@@ -159,6 +188,52 @@ class ToolHub:
         
         return success
     
+    def _map_tool(self, tool_name: str, server: MCPServer) -> None:
+        """Point ``tool_name`` at ``server`` in every registry index.
+        
+        Args:
+            tool_name: Name of the tool
+            server: Server that now owns the tool
+        """
+        previous = self.tool_registry.get(tool_name)
+        if previous is not None and previous != server.server_id:
+            self._server_tools[previous].discard(tool_name)
+        
+        self.tool_registry[tool_name] = server.server_id
+        self._tool_servers[tool_name] = server
+        self._server_tools.setdefault(server.server_id, set()).add(tool_name)
+        
+        self._uncount_category(tool_name)
+        category = server.get_tool_definition(tool_name).category
+        self._tool_categories[tool_name] = category
+        self._category_counts[category] += 1
+    
+    def _unmap_tool(self, tool_name: str) -> None:
+        """Drop ``tool_name`` from every registry index.
+        
+        Args:
+            tool_name: Name of the tool
+        """
+        server_id = self.tool_registry.pop(tool_name)
+        del self._tool_servers[tool_name]
+        server_tools = self._server_tools.get(server_id)
+        if server_tools is not None:
+            server_tools.discard(tool_name)
+        self._uncount_category(tool_name)
+    
+    def _uncount_category(self, tool_name: str) -> None:
+        """Release the category count held by ``tool_name``, if any.
+        
+        Args:
+            tool_name: Name of the tool
+        """
+        category = self._tool_categories.pop(tool_name, None)
+        if category is None:
+            return
+        self._category_counts[category] -= 1
+        if not self._category_counts[category]:
+            del self._category_counts[category]
+    
     async def execute_tool(
         self,
         tool_name: str,
@@ -175,10 +250,11 @@ class ToolHub:
         Returns:
             Tool execution result
         """
-        with tracer.start_as_current_span("tool_hub.execute_tool") as span:
+        with maybe_span(tracer, "tool_hub.execute_tool") as span:
             span.set_attribute("tool_name", tool_name)
             
-            if tool_name not in self.tool_registry:
+            server = self._tool_servers.get(tool_name)
+            if server is None:
                 error_msg = f"Tool '{tool_name}' not found in hub"
                 logger.error(error_msg)
                 return ToolResult(
@@ -186,23 +262,50 @@ class ToolHub:
                     error=error_msg,
                 )
             
-            server_id = self.tool_registry[tool_name]
-            server = self.servers[server_id]
+            definition = server.get_tool_definition(tool_name)
+            if definition is not None and definition.category in _BOUNDED_CATEGORIES:
+                async with self._compute_slots:
+                    return await server.execute_tool(tool_name, parameters, context)
             
             return await server.execute_tool(tool_name, parameters, context)
     
-    def get_available_tools(self) -> List[MCPToolDefinition]:
-        """Get all available tools across all servers.
+    def _refresh_tool_cache(self) -> None:
+        """Rebuild the flattened tool list and category index if stale.
         
-        Returns:
-            List of tool definitions
+        Every hub mutation bumps ``_generation``, so listings only walk the
+        servers once per registry change.
         """
-        tools = []
+        if self._cache_generation == self._generation:
+            return
         
+        tools: List[MCPToolDefinition] = []
         for server in self.servers.values():
             tools.extend(server.get_tool_definitions())
         
-        return tools
+        by_category: Dict[str, List[MCPToolDefinition]] = {}
+        search_text: List[Tuple[str, str]] = []
+        trigram_index: Dict[str, Set[int]] = {}
+        for position, tool in enumerate(tools):
+            by_category.setdefault(tool.category, []).append(tool)
+            name_lower, description_lower = tool.name.lower(), tool.description.lower()
+            search_text.append((name_lower, description_lower))
+            for gram in _trigrams(name_lower) | _trigrams(description_lower):
+                trigram_index.setdefault(gram, set()).add(position)
+        
+        self._cached_tools = tools
+        self._cached_by_category = by_category
+        self._search_text = search_text
+        self._trigram_index = trigram_index
+        self._cache_generation = self._generation
+    
+    def get_available_tools(self) -> List[MCPToolDefinition]:
+        """Get all available tools across all servers.
+        
+        Returns:
+            List of tool definitions
+        """
+        self._refresh_tool_cache()
+        return list(self._cached_tools)
     
     def get_tools_by_category(self, category: str) -> List[MCPToolDefinition]:
         """Get tools by category.
@@ -213,8 +316,8 @@ class ToolHub:
         Returns:
             List of tool definitions in the category
         """
-        all_tools = self.get_available_tools()
-        return [tool for tool in all_tools if tool.category == category]
+        self._refresh_tool_cache()
+        return list(self._cached_by_category.get(category, ()))
     
     def get_tool_definition(self, tool_name: str) -> Optional[MCPToolDefinition]:
         """Get a specific tool definition.
@@ -225,12 +328,10 @@ class ToolHub:
         Returns:
             Tool definition if found, None otherwise
         """
-        if tool_name not in self.tool_registry:
+        server = self._tool_servers.get(tool_name)
+        if server is None:
             return None
         
-        server_id = self.tool_registry[tool_name]
-        server = self.servers[server_id]
-        
         return server.get_tool_definition(tool_name)
     
     def search_tools(
@@ -247,53 +348,63 @@ class ToolHub:
         Returns:
             List of matching tool definitions
         """
-        all_tools = self.get_available_tools()
+        self._refresh_tool_cache()
+        query_lower = query.lower()
         
-        # Filter by category if specified
-        if category:
-            all_tools = [tool for tool in all_tools if tool.category == category]
+        # Narrow to tools containing every trigram of the query; shorter
+        # queries have no trigrams and fall back to checking every tool
+        query_grams = _trigrams(query_lower)
+        if query_grams:
+            postings = sorted((self._trigram_index.get(gram, set()) for gram in query_grams), key=len)
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(len(self._cached_tools))
         
-        # Search in name and description
-        query_lower = query.lower()
+        # Confirm the substring match in name or description, then filter by category
         matching_tools = []
-        
-        for tool in all_tools:
-            if (query_lower in tool.name.lower() or 
-                query_lower in tool.description.lower()):
+        for position in candidates:
+            tool = self._cached_tools[position]
+            if category and tool.category != category:
+                continue
+            name_lower, description_lower = self._search_text[position]
+            if query_lower in name_lower or query_lower in description_lower:
                 matching_tools.append(tool)
         
         return matching_tools
     
     async def start_all_servers(self) -> None:
-        """Start all registered servers."""
-        for server_id, server in self.servers.items():
-            try:
-                await server.start()
-                logger.info(
-                    "Server started",
-                    server_id=server_id,
-                )
-            except Exception as e:
-                logger.error(
-                    "Failed to start server",
-                    server_id=server_id,
-                    error=str(e),
-                )
+        """Start all registered servers concurrently."""
+        await self._run_on_all_servers("start", "Server started", "Failed to start server")
     
     async def stop_all_servers(self) -> None:
-        """Stop all registered servers."""
-        for server_id, server in self.servers.items():
-            try:
-                await server.stop()
-                logger.info(
-                    "Server stopped",
+        """Stop all registered servers concurrently."""
+        await self._run_on_all_servers("stop", "Server stopped", "Failed to stop server")
+    
+    async def _run_on_all_servers(self, method: str, success_msg: str, failure_msg: str) -> None:
+        """Await ``method`` on every server at once and log each outcome.
+        
+        Args:
+            method: Name of the server coroutine method (``start``/``stop``)
+            success_msg: Log message for servers that succeeded
+            failure_msg: Log message for servers that raised
+        """
+        servers = list(self.servers.items())
+        results = await asyncio.gather(
+            *(getattr(server, method)() for _, server in servers),
+            return_exceptions=True,
+        )
+        
+        for (server_id, _), result in zip(servers, results):
+            if isinstance(result, Exception):
+                logger.error(
+                    failure_msg,
                     server_id=server_id,
+                    error=str(result),
                 )
-            except Exception as e:
-                logger.error(
-                    "Failed to stop server",
+            else:
+                logger.info(
+                    success_msg,
                     server_id=server_id,
-                    error=str(e),
                 )
     
     def get_hub_status(self) -> Dict[str, Any]:
@@ -315,30 +426,42 @@ class ToolHub:
             "total_tools": total_tools,
             "tool_registry_size": len(self.tool_registry),
             "servers": server_statuses,
-            "enabled_tool_categories": list(set(
-                tool.category for tool in self.get_available_tools()
-            )),
+            "enabled_tool_categories": list(self._category_counts),
         }
     
     def get_hub_metrics(self) -> Dict[str, Any]:
         """Get hub metrics.
         
+        The snapshot is reused for ``settings.monitoring.metrics_scrape_interval``
+        seconds, or until a server or tool is (un)registered.
+        
         Returns:
             Hub metrics dictionary
         """
+        now = time.monotonic()
+        if (
+            self._metrics_cache is not None
+            and now < self._metrics_expires_at
+            and self._metrics_generation == self._generation
+        ):
+            return self._metrics_cache
+        
         server_metrics = {}
         
         for server_id, server in self.servers.items():
             server_metrics[server_id] = server.get_metrics()
         
-        return {
+        self._metrics_cache = {
             "servers": server_metrics,
             "timestamp": datetime.utcnow().isoformat(),
         }
+        self._metrics_expires_at = now + settings.monitoring.metrics_scrape_interval
+        self._metrics_generation = self._generation
+        return self._metrics_cache
 
 
-# Global tool hub instance
-tool_hub = ToolHub()
+# Global tool hub instance, created on first use rather than at import
+_tool_hub: Optional[ToolHub] = None
 
 
 def get_tool_hub() -> ToolHub:
@@ -347,4 +470,7 @@ def get_tool_hub() -> ToolHub:
     Returns:
         Tool hub instance
     """
-    return tool_hub
\ No newline at end of file
+    global _tool_hub
+    if _tool_hub is None:
+        _tool_hub = ToolHub()
+    return _tool_hub
\ No newline at end of file
@@ -1,15 +1,16 @@
 """MCP Server implementation following MCP standards."""
 
-import asyncio
 import json
-from typing import Any, Dict, List, Optional, Callable
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, ValidationError
 
 from ai_financial.core.config import settings
-from ai_financial.core.logging import get_logger, get_tracer
+from ai_financial.core.logging import get_logger, get_tracer, maybe_span
 from ai_financial.mcp.tools.base_tool import BaseTool, ToolResult
 
 logger = get_logger(__name__)
@@ -91,8 +92,20 @@ class MCPServer:
         self.port = port
         
         # Tool registry
-        self._tools: Dict[str, BaseTool] = {}
-        self._tool_definitions: Dict[str, MCPToolDefinition] = {}
+        # tool_name -> (tool, definition), so registration and lookup touch one dict
+        self._tools: Dict[str, Tuple[BaseTool, MCPToolDefinition]] = {}
+        # model_dump() of each definition, taken once at registration; read-only
+        self._tool_dumps: Dict[str, Dict[str, Any]] = {}
+        # tools/list payload and its JSON encoding, rebuilt on first use after a (un)registration
+        self._tools_list: Optional[List[Dict[str, Any]]] = None
+        self._tools_list_json: Optional[bytes] = None
+        
+        # JSON-RPC method -> handler
+        self._dispatch: Dict[str, Callable[[MCPRequest], Awaitable[MCPResponse]]] = {
+            "tools/list": self._handle_list,
+            "tools/call": self._handle_call,
+            "tools/get": self._handle_get,
+        }
         
         # Server state
         self._running = False
@@ -112,7 +125,7 @@ class MCPServer:
         Args:
             tool: Tool instance to register
         """
-        with tracer.start_as_current_span("mcp_server.register_tool"):
+        with maybe_span(tracer, "mcp_server.register_tool"):
             tool_name = tool.get_name()
             
             if tool_name in self._tools:
@@ -122,19 +135,12 @@ class MCPServer:
                     server_id=self.server_id,
                 )
             
-            self._tools[tool_name] = tool
-            
-            # Create tool definition
-            definition = MCPToolDefinition(
-                name=tool_name,
-                description=tool.get_description(),
-                parameters=tool.get_parameters_schema(),
-                required_permissions=tool.get_required_permissions(),
-                category=tool.get_category(),
-                version=tool.get_version(),
-            )
+            # Tool definition is memoized on the tool itself
+            definition = tool.as_mcp_definition()
             
-            self._tool_definitions[tool_name] = definition
+            self._tools[tool_name] = (tool, definition)
+            self._tool_dumps[tool_name] = definition.model_dump()
+            self._tools_list = self._tools_list_json = None
             
             logger.info(
                 "Tool registered",
@@ -152,18 +158,18 @@ class MCPServer:
         Returns:
             True if tool was unregistered, False if not found
         """
-        if tool_name in self._tools:
-            del self._tools[tool_name]
-            del self._tool_definitions[tool_name]
-            
-            logger.info(
-                "Tool unregistered",
-                tool_name=tool_name,
-                server_id=self.server_id,
-            )
-            return True
+        if self._tools.pop(tool_name, None) is None:
+            return False
         
-        return False
+        del self._tool_dumps[tool_name]
+        self._tools_list = self._tools_list_json = None
+        
+        logger.info(
+            "Tool unregistered",
+            tool_name=tool_name,
+            server_id=self.server_id,
+        )
+        return True
     
     def get_tool_definitions(self) -> List[MCPToolDefinition]:
         """Get all registered tool definitions.
@@ -171,7 +177,7 @@ class MCPServer:
         Returns:
             List of tool definitions
         """
-        return list(self._tool_definitions.values())
+        return [definition for _, definition in self._tools.values()]
     
     def get_tool_definition(self, tool_name: str) -> Optional[MCPToolDefinition]:
         """Get a specific tool definition.
@@ -182,7 +188,8 @@ class MCPServer:
         Returns:
             Tool definition if found, None otherwise
         """
-        return self._tool_definitions.get(tool_name)
+        entry = self._tools.get(tool_name)
+        return entry[1] if entry is not None else None
     
     async def execute_tool(
         self,
@@ -200,10 +207,11 @@ class MCPServer:
         Returns:
             Tool execution result
         """
-        with tracer.start_as_current_span("mcp_server.execute_tool") as span:
+        with maybe_span(tracer, "mcp_server.execute_tool") as span:
             span.set_attribute("tool_name", tool_name)
             
-            if tool_name not in self._tools:
+            entry = self._tools.get(tool_name)
+            if entry is None:
                 error_msg = f"Tool '{tool_name}' not found"
                 logger.error(error_msg, server_id=self.server_id)
                 return ToolResult(
@@ -211,14 +219,13 @@ class MCPServer:
                     error=error_msg,
                     execution_time=0.0,
                 )
+            tool = entry[0]
             
-            tool = self._tools[tool_name]
-            
+            start_time = time.perf_counter()
             try:
                 # Execute tool
-                start_time = asyncio.get_event_loop().time()
                 result = await tool.execute(parameters, context)
-                execution_time = asyncio.get_event_loop().time() - start_time
+                execution_time = time.perf_counter() - start_time
                 
                 # Update execution time
                 result.execution_time = execution_time
@@ -234,7 +241,7 @@ class MCPServer:
                 return result
                 
             except Exception as e:
-                execution_time = asyncio.get_event_loop().time() - start_time
+                execution_time = time.perf_counter() - start_time
                 error_msg = f"Tool execution failed: {str(e)}"
                 
                 logger.error(
@@ -260,78 +267,22 @@ class MCPServer:
         Returns:
             MCP response
         """
-        with tracer.start_as_current_span("mcp_server.handle_request") as span:
+        with maybe_span(tracer, "mcp_server.handle_request") as span:
             span.set_attribute("method", request.method)
             span.set_attribute("request_id", request.id)
             
+            handler = self._dispatch.get(request.method)
+            if handler is None:
+                return MCPResponse(
+                    id=request.id,
+                    error={
+                        "code": -32601,
+                        "message": f"Method '{request.method}' not found"
+                    }
+                )
+            
             try:
-                if request.method == "tools/list":
-                    # List available tools
-                    tools = [def_.model_dump() for def_ in self.get_tool_definitions()]
-                    return MCPResponse(
-                        id=request.id,
-                        result={"tools": tools}
-                    )
-                
-                elif request.method == "tools/call":
-                    # Execute a tool
-                    tool_name = request.params.get("name")
-                    parameters = request.params.get("arguments", {})
-                    
-                    if not tool_name:
-                        return MCPResponse(
-                            id=request.id,
-                            error={
-                                "code": -32602,
-                                "message": "Invalid params: 'name' is required"
-                            }
-                        )
-                    
-                    result = await self.execute_tool(tool_name, parameters)
-                    
-                    return MCPResponse(
-                        id=request.id,
-                        result=result.model_dump()
-                    )
-                
-                elif request.method == "tools/get":
-                    # Get tool definition
-                    tool_name = request.params.get("name")
-                    
-                    if not tool_name:
-                        return MCPResponse(
-                            id=request.id,
-                            error={
-                                "code": -32602,
-                                "message": "Invalid params: 'name' is required"
-                            }
-                        )
-                    
-                    definition = self.get_tool_definition(tool_name)
-                    
-                    if definition:
-                        return MCPResponse(
-                            id=request.id,
-                            result=definition.model_dump()
-                        )
-                    else:
-                        return MCPResponse(
-                            id=request.id,
-                            error={
-                                "code": -32601,
-                                "message": f"Tool '{tool_name}' not found"
-                            }
-                        )
-                
-                else:
-                    return MCPResponse(
-                        id=request.id,
-                        error={
-                            "code": -32601,
-                            "message": f"Method '{request.method}' not found"
-                        }
-                    )
-                    
+                return await handler(request)
             except Exception as e:
                 logger.error(
                     "Request handling failed",
@@ -348,6 +299,119 @@ class MCPServer:
                     }
                 )
     
+    async def _handle_list(self, request: MCPRequest) -> MCPResponse:
+        """Handle ``tools/list``: list available tools."""
+        # Success responses are built from trusted values, so skip
+        # re-validation via model_construct
+        return MCPResponse.model_construct(
+            id=request.id,
+            result={"tools": self._get_tools_list()}
+        )
+    
+    def _get_tools_list(self) -> List[Dict[str, Any]]:
+        """Get the cached ``tools/list`` payload, rebuilding it if stale."""
+        if self._tools_list is None:
+            self._tools_list = list(self._tool_dumps.values())
+        return self._tools_list
+    
+    def _get_tools_list_json(self) -> bytes:
+        """Get the cached JSON encoding of the ``tools/list`` payload."""
+        if self._tools_list_json is None:
+            self._tools_list_json = orjson.dumps(self._get_tools_list(), default=str)
+        return self._tools_list_json
+    
+    async def _handle_call(self, request: MCPRequest) -> MCPResponse:
+        """Handle ``tools/call``: execute a tool."""
+        tool_name = request.params.get("name")
+        parameters = request.params.get("arguments", {})
+        
+        if not tool_name:
+            return MCPResponse(
+                id=request.id,
+                error={
+                    "code": -32602,
+                    "message": "Invalid params: 'name' is required"
+                }
+            )
+        
+        result = await self.execute_tool(tool_name, parameters)
+        
+        return MCPResponse.model_construct(
+            id=request.id,
+            result=result.model_dump()
+        )
+    
+    async def _handle_get(self, request: MCPRequest) -> MCPResponse:
+        """Handle ``tools/get``: get a tool definition."""
+        tool_name = request.params.get("name")
+        
+        if not tool_name:
+            return MCPResponse(
+                id=request.id,
+                error={
+                    "code": -32602,
+                    "message": "Invalid params: 'name' is required"
+                }
+            )
+        
+        definition = self._tool_dumps.get(tool_name)
+        
+        if definition:
+            return MCPResponse.model_construct(
+                id=request.id,
+                result=definition
+            )
+        
+        return MCPResponse(
+            id=request.id,
+            error={
+                "code": -32601,
+                "message": f"Tool '{tool_name}' not found"
+            }
+        )
+    
+    async def handle_raw(self, raw: bytes) -> bytes:
+        """Handle a JSON-encoded MCP request and return the encoded response.
+        
+        The wire boundary goes through orjson in both directions; Pydantic is
+        only used to validate the decoded request.
+        
+        Args:
+            raw: JSON request body
+            
+        Returns:
+            JSON response body
+        """
+        try:
+            request = MCPRequest.model_validate(orjson.loads(raw))
+        except orjson.JSONDecodeError as e:
+            response = MCPResponse(
+                id="",
+                error={
+                    "code": -32700,
+                    "message": f"Parse error: {str(e)}"
+                }
+            )
+        except ValidationError as e:
+            response = MCPResponse(
+                id="",
+                error={
+                    "code": -32600,
+                    "message": f"Invalid request: {str(e)}"
+                }
+            )
+        else:
+            if request.method == "tools/list":
+                # Splice in the pre-encoded listing rather than re-encoding every definition
+                response = MCPResponse.model_construct(
+                    id=request.id,
+                    result={"tools": orjson.Fragment(self._get_tools_list_json())}
+                )
+            else:
+                response = await self.handle_request(request)
+        
+        return orjson.dumps(response.model_dump(), default=str)
+    
     async def start(self) -> None:
         """Start the MCP server."""
         if self._running:
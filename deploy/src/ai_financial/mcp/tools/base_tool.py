@@ -1,7 +1,7 @@
 """Base tool class for MCP tools."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 from datetime import datetime
 from uuid import uuid4
 
@@ -9,6 +9,9 @@ from pydantic import BaseModel, Field
 
 from ai_financial.core.logging import get_logger, get_tracer
 
+if TYPE_CHECKING:
+    from ai_financial.mcp.server import MCPToolDefinition
+
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
@@ -65,6 +68,9 @@ class BaseTool(ABC):
         self._total_execution_time = 0.0
         self._error_count = 0
         
+        # Built on first as_mcp_definition() call; tool metadata is fixed after init
+        self._mcp_definition: Optional["MCPToolDefinition"] = None
+        
         logger.info(
             "Tool initialized",
             tool_name=self.name,
@@ -138,6 +144,28 @@ class BaseTool(ABC):
         """
         return self.required_permissions
     
+    def as_mcp_definition(self) -> "MCPToolDefinition":
+        """Get the MCP definition describing this tool.
+        
+        The definition is built and validated once, then reused by every
+        server the tool is registered with.
+        
+        Returns:
+            MCP tool definition
+        """
+        if self._mcp_definition is None:
+            from ai_financial.mcp.server import MCPToolDefinition  # Lazy import: server imports this module
+            
+            self._mcp_definition = MCPToolDefinition(
+                name=self.get_name(),
+                description=self.get_description(),
+                parameters=self.get_parameters_schema(),
+                required_permissions=self.get_required_permissions(),
+                category=self.get_category(),
+                version=self.get_version(),
+            )
+        return self._mcp_definition
+    
     def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
         """Validate tool parameters against schema.
         
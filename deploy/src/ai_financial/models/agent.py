@@ -2,14 +2,13 @@
 Agent and workflow models
 """
 
-from sqlalchemy import Column, String, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import DDL, Column, String, DateTime, Text, Index, Integer, ForeignKey, event, text
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-import uuid
 
-from ..core.database import Base
+from ..core.database import Base, uuid7
 from .enums import WorkflowStatus, ApprovalStatus, AgentType
 
 
@@ -17,15 +16,18 @@ class AgentContext(Base):
     """Agent execution context model"""
     
     __tablename__ = "agent_contexts"
+    __table_args__ = (
+        Index("ix_agent_contexts_state_gin", "state", postgresql_using="gin", postgresql_ops={"state": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     agent_id = Column(String(100), nullable=False)
     agent_type = Column(String(50), nullable=False)  # AgentType enum
     session_id = Column(String(100), nullable=False)
     user_id = Column(String(100), nullable=True)
     company_id = Column(String(100), nullable=True)
-    permissions = Column(JSON, nullable=True)  # List of permission strings
-    state = Column(JSON, nullable=True)  # Agent state data
+    permissions = Column(JSONB, nullable=True)  # List of permission strings
+    state = Column(JSONB, nullable=True)  # Agent state data
     trace_id = Column(String(100), nullable=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -39,18 +41,21 @@ class WorkflowState(Base):
     """Workflow state management model"""
     
     __tablename__ = "workflow_states"
+    __table_args__ = (
+        Index("ix_workflow_states_data_gin", "data", postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workflow_id = Column(String(100), nullable=False, unique=True)
     workflow_type = Column(String(50), nullable=False)  # e.g., "advisory", "transactional"
     current_step = Column(String(100), nullable=False)
-    steps_completed = Column(JSON, nullable=True)  # List of completed step names
+    steps_completed = Column(JSONB, nullable=True)  # List of completed step names
     status = Column(String(20), nullable=False, default=WorkflowStatus.PENDING)
-    data = Column(JSON, nullable=True)  # Workflow data
+    data = Column(JSONB, nullable=True)  # Workflow data
     error_message = Column(Text, nullable=True)
     
     # Relationships
-    approval_requests = relationship("ApprovalRequest", back_populates="workflow", cascade="all, delete-orphan")
+    approval_requests = relationship("ApprovalRequest", back_populates="workflow", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -63,8 +68,15 @@ class ApprovalRequest(Base):
     """Approval request model for HITL workflows"""
     
     __tablename__ = "approval_requests"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        Index("ix_approval_requests_data_gin", "data", postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"}),
+        # Expiry sweeps only ever look at pending requests
+        Index("ix_approval_requests_pending_expires_at", "expires_at", postgresql_where=text("status = 'pending'")),
+        # Covering index: an approver's queue by status is answered from the index alone
+        Index("ix_approval_requests_approver_status", "approver_id", "status", postgresql_include=["title", "priority", "expires_at"]),
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     request_type = Column(String(50), nullable=False)  # e.g., "transaction_approval", "policy_exception"
     title = Column(String(200), nullable=False)
     description = Column(Text, nullable=True)
@@ -72,14 +84,14 @@ class ApprovalRequest(Base):
     approver_id = Column(String(100), nullable=True)
     status = Column(String(20), nullable=False, default=ApprovalStatus.PENDING)
     priority = Column(String(20), nullable=False, default="medium")  # low, medium, high, critical
-    data = Column(JSON, nullable=True)  # Request-specific data
+    data = Column(JSONB, nullable=True)  # Request-specific data
     approval_reason = Column(Text, nullable=True)
     rejection_reason = Column(Text, nullable=True)
     expires_at = Column(DateTime, nullable=True)
     approved_at = Column(DateTime, nullable=True)
     
     # Relationships
-    workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflow_states.id"), nullable=True)
+    workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflow_states.id", ondelete="CASCADE"), nullable=True, index=True)
     workflow = relationship("WorkflowState", back_populates="approval_requests")
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -93,37 +105,61 @@ class AgentExecution(Base):
     """Agent execution tracking model"""
     
     __tablename__ = "agent_executions"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        Index("ix_agent_executions_input_data_gin", "input_data", postgresql_using="gin", postgresql_ops={"input_data": "jsonb_path_ops"}),
+        Index("ix_agent_executions_output_data_gin", "output_data", postgresql_using="gin", postgresql_ops={"output_data": "jsonb_path_ops"}),
+        # Append-only log, range-partitioned by start time (partition key must be in the PK)
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     agent_type = Column(String(50), nullable=False)  # AgentType enum
     execution_id = Column(String(100), nullable=False)
-    input_data = Column(JSON, nullable=True)
-    output_data = Column(JSON, nullable=True)
+    input_data = Column(JSONB, nullable=True)
+    output_data = Column(JSONB, nullable=True)
     status = Column(String(20), nullable=False)  # success, error, timeout
-    execution_time_ms = Column(String(20), nullable=True)
+    execution_time_ms = Column(Integer, nullable=True)
     error_message = Column(Text, nullable=True)
     trace_id = Column(String(100), nullable=True)
     
+    # Hot lookup fields hoisted out of input_data so they get plain B-tree indexes
+    user_id = Column(String(100), nullable=True, index=True)
+    tool_name = Column(String(100), nullable=True, index=True)
+    
     # Context information
     context_id = Column(UUID(as_uuid=True), ForeignKey("agent_contexts.id"), nullable=True)
     context = relationship("AgentContext")
     
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     
     def __repr__(self) -> str:
         return f"<AgentExecution(id={self.id}, agent_type={self.agent_type}, status={self.status})>"
 
 
+# A partitioned table rejects rows until a partition exists; the default partition
+# catches anything outside the monthly partitions managed by ops (e.g. pg_partman)
+event.listen(
+    AgentExecution.__table__,
+    "after_create",
+    DDL("CREATE TABLE agent_executions_default PARTITION OF agent_executions DEFAULT").execute_if(dialect="postgresql"),
+)
+
+
 class AgentMemory(Base):
     """Agent memory storage model"""
     
     __tablename__ = "agent_memories"
+    __table_args__ = (
+        Index("ix_agent_memories_memory_value_gin", "memory_value", postgresql_using="gin", postgresql_ops={"memory_value": "jsonb_path_ops"}),
+        Index("ix_agent_memories_agent_id_memory_key", "agent_id", "memory_key", unique=True),
+        Index("ix_agent_memories_expires_at", "expires_at"),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     agent_id = Column(String(100), nullable=False)
     memory_key = Column(String(200), nullable=False)
-    memory_value = Column(JSON, nullable=False)
+    memory_value = Column(JSONB, nullable=False)
     memory_type = Column(String(50), nullable=False)  # e.g., "conversation", "context", "learned_pattern"
     expires_at = Column(DateTime, nullable=True)
     
@@ -1,12 +1,13 @@
 """Agent-related data models."""
 
+import asyncio
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
 from langchain.schema import BaseMessage
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class AgentStatus(str, Enum):
@@ -44,6 +45,12 @@ class AgentState(BaseModel):
     completed_steps: List[str] = Field(default_factory=list, description="Completed steps")
     error: Optional[str] = Field(None, description="Error message if any")
     
+    # Typed result slots written by individual workflow nodes
+    analysis_results: Dict[str, Any] = Field(default_factory=dict, description="Financial analysis results")
+    insights: Dict[str, Any] = Field(default_factory=dict, description="Insights drawn from the analysis")
+    risk_assessment: Dict[str, Any] = Field(default_factory=dict, description="Risk assessment")
+    recommendations: Dict[str, Any] = Field(default_factory=dict, description="Actionable recommendations")
+    
     class Config:
         arbitrary_types_allowed = True
 
@@ -63,6 +70,9 @@ class ApprovalRequest(BaseModel):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     expires_at: Optional[datetime] = Field(None, description="Expiration time")
     
+    # Set once the request is approved or rejected, so waiters wake without polling
+    _decided: asyncio.Event = PrivateAttr(default_factory=asyncio.Event)
+    
     @property
     def is_approved(self) -> bool:
         """Check if request is fully approved."""
@@ -80,6 +90,28 @@ class ApprovalRequest(BaseModel):
         if not self.expires_at:
             return False
         return datetime.utcnow() > self.expires_at
+    
+    def mark_decided(self) -> None:
+        """Wake everyone waiting for this request to be approved or rejected."""
+        self._decided.set()
+    
+    async def wait_for_decision(self, timeout: float) -> bool:
+        """Wait until the request is approved or rejected.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            
+        Returns:
+            True if a decision was made, False on timeout
+        """
+        if self.is_approved or self.status != "pending":
+            return True
+        
+        try:
+            await asyncio.wait_for(self._decided.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
 
 
 class WorkflowState(BaseModel):
@@ -147,8 +179,10 @@ class WorkflowState(BaseModel):
                 
                 if approved and request.is_approved:
                     request.status = "approved"
+                    request.mark_decided()
                 elif not approved:
                     request.status = "rejected"
+                    request.mark_decided()
                 
                 self.updated_at = datetime.utcnow()
                 return True
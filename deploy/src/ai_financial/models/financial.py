@@ -8,9 +8,8 @@ from sqlalchemy.dialects.postgresql import UUID
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, Any, List, Optional
-import uuid
 
-from ..core.database import Base
+from ..core.database import Base, uuid7
 from .enums import TransactionType, TransactionStatus, AccountType, InvoiceStatus, ForecastType
 
 
@@ -19,7 +18,7 @@ class Transaction(Base):
     
     __tablename__ = "transactions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     amount = Column(Numeric(precision=15, scale=2), nullable=False)
     currency = Column(String(3), nullable=False, default="USD")
     date = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -47,7 +46,7 @@ class Account(Base):
     
     __tablename__ = "accounts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(200), nullable=False)
     type = Column(String(20), nullable=False)  # AccountType enum
     balance = Column(Numeric(precision=15, scale=2), nullable=False, default=0)
@@ -71,7 +70,7 @@ class Invoice(Base):
     
     __tablename__ = "invoices"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     invoice_number = Column(String(100), nullable=False, unique=True)
     amount = Column(Numeric(precision=15, scale=2), nullable=False)
     currency = Column(String(3), nullable=False, default="USD")
@@ -83,7 +82,7 @@ class Invoice(Base):
     confidence_score = Column(Float, nullable=True)
     
     # Relationships
-    line_items = relationship("InvoiceLineItem", back_populates="invoice", cascade="all, delete-orphan")
+    line_items = relationship("InvoiceLineItem", back_populates="invoice", cascade="all, delete-orphan", passive_deletes=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -97,14 +96,14 @@ class InvoiceLineItem(Base):
     
     __tablename__ = "invoice_line_items"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     description = Column(Text, nullable=False)
     quantity = Column(Numeric(precision=10, scale=2), nullable=False)
     unit_price = Column(Numeric(precision=15, scale=2), nullable=False)
     total_amount = Column(Numeric(precision=15, scale=2), nullable=False)
     
     # Relationships
-    invoice_id = Column(UUID(as_uuid=True), ForeignKey("invoices.id"), nullable=False)
+    invoice_id = Column(UUID(as_uuid=True), ForeignKey("invoices.id", ondelete="CASCADE"), nullable=False)
     invoice = relationship("Invoice", back_populates="line_items")
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -119,7 +118,7 @@ class Forecast(Base):
     
     __tablename__ = "forecasts"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     type = Column(String(20), nullable=False)  # ForecastType enum
     period_start = Column(DateTime, nullable=False)
     period_end = Column(DateTime, nullable=False)
@@ -127,7 +126,7 @@ class Forecast(Base):
     methodology = Column(String(100), nullable=True)
     
     # Relationships
-    predictions = relationship("ForecastPrediction", back_populates="forecast", cascade="all, delete-orphan")
+    predictions = relationship("ForecastPrediction", back_populates="forecast", cascade="all, delete-orphan", passive_deletes=True)
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -141,7 +140,7 @@ class ForecastPrediction(Base):
     
     __tablename__ = "forecast_predictions"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     date = Column(DateTime, nullable=False)
     predicted_value = Column(Numeric(precision=15, scale=2), nullable=False)
     confidence_score = Column(Float, nullable=True)
@@ -149,7 +148,7 @@ class ForecastPrediction(Base):
     metadata = Column(JSON, nullable=True)
     
     # Relationships
-    forecast_id = Column(UUID(as_uuid=True), ForeignKey("forecasts.id"), nullable=False)
+    forecast_id = Column(UUID(as_uuid=True), ForeignKey("forecasts.id", ondelete="CASCADE"), nullable=False)
     forecast = relationship("Forecast", back_populates="predictions")
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -2,14 +2,13 @@
 Integration and external system models
 """
 
-from sqlalchemy import Column, String, DateTime, Text, JSON, Boolean
+from sqlalchemy import DDL, Column, String, DateTime, Text, Index, Integer, SmallInteger, Boolean, ForeignKey, LargeBinary, event
 from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from datetime import datetime
 from typing import Dict, Any, List, Optional
-import uuid
 
-from ..core.database import Base
+from ..core.database import Base, uuid7
 from .enums import SystemType, ConnectionStatus
 
 
@@ -17,18 +16,21 @@ class ExternalSystem(Base):
     """External system connection model"""
     
     __tablename__ = "external_systems"
+    __table_args__ = (
+        Index("ix_external_systems_connection_config_gin", "connection_config", postgresql_using="gin", postgresql_ops={"connection_config": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(200), nullable=False)
     type = Column(String(20), nullable=False)  # SystemType enum
-    connection_config = Column(JSON, nullable=False)  # API endpoints, credentials, etc.
+    connection_config = Column(JSONB, nullable=False)  # API endpoints, credentials, etc.
     sync_frequency = Column(String(50), nullable=True)  # e.g., "hourly", "daily", "real-time"
     last_sync = Column(DateTime, nullable=True)
     status = Column(String(20), nullable=False, default=ConnectionStatus.DISCONNECTED)
     is_active = Column(Boolean, default=True)
     
     # Relationships
-    data_mappings = relationship("DataMapping", back_populates="external_system", cascade="all, delete-orphan")
+    data_mappings = relationship("DataMapping", back_populates="external_system", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -41,19 +43,22 @@ class DataMapping(Base):
     """Data mapping configuration model"""
     
     __tablename__ = "data_mappings"
+    __table_args__ = (
+        Index("ix_data_mappings_field_mappings_gin", "field_mappings", postgresql_using="gin", postgresql_ops={"field_mappings": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     source_system = Column(String(100), nullable=False)
     target_system = Column(String(100), nullable=False)
-    field_mappings = Column(JSON, nullable=False)  # Dict mapping source fields to target fields
+    field_mappings = Column(JSONB, nullable=False)  # Dict mapping source fields to target fields
     is_active = Column(Boolean, default=True)
     
     # Relationships
-    external_system_id = Column(UUID(as_uuid=True), nullable=True)
+    external_system_id = Column(UUID(as_uuid=True), ForeignKey("external_systems.id", ondelete="CASCADE"), nullable=True, index=True)
     external_system = relationship("ExternalSystem", back_populates="data_mappings")
     
-    transformation_rules = relationship("TransformationRule", back_populates="data_mapping", cascade="all, delete-orphan")
-    validation_rules = relationship("ValidationRule", back_populates="data_mapping", cascade="all, delete-orphan")
+    transformation_rules = relationship("TransformationRule", back_populates="data_mapping", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    validation_rules = relationship("ValidationRule", back_populates="data_mapping", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
     
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -66,17 +71,20 @@ class TransformationRule(Base):
     """Data transformation rule model"""
     
     __tablename__ = "transformation_rules"
+    __table_args__ = (
+        Index("ix_transformation_rules_transformation_config_gin", "transformation_config", postgresql_using="gin", postgresql_ops={"transformation_config": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     rule_name = Column(String(200), nullable=False)
     field_name = Column(String(100), nullable=False)
     transformation_type = Column(String(50), nullable=False)  # e.g., "format", "calculate", "lookup"
-    transformation_config = Column(JSON, nullable=False)  # Configuration for the transformation
-    order = Column(String(10), nullable=False, default=1)  # Execution order
+    transformation_config = Column(JSONB, nullable=False)  # Configuration for the transformation
+    order = Column(SmallInteger, nullable=False, default=1)  # Execution order
     is_active = Column(Boolean, default=True)
     
     # Relationships
-    data_mapping_id = Column(UUID(as_uuid=True), nullable=False)
+    data_mapping_id = Column(UUID(as_uuid=True), ForeignKey("data_mappings.id", ondelete="CASCADE"), nullable=False, index=True)
     data_mapping = relationship("DataMapping", back_populates="transformation_rules")
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -90,17 +98,20 @@ class ValidationRule(Base):
     """Data validation rule model"""
     
     __tablename__ = "validation_rules"
+    __table_args__ = (
+        Index("ix_validation_rules_validation_config_gin", "validation_config", postgresql_using="gin", postgresql_ops={"validation_config": "jsonb_path_ops"}),
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     rule_name = Column(String(200), nullable=False)
     field_name = Column(String(100), nullable=False)
     validation_type = Column(String(50), nullable=False)  # e.g., "required", "format", "range", "custom"
-    validation_config = Column(JSON, nullable=False)  # Configuration for the validation
+    validation_config = Column(JSONB, nullable=False)  # Configuration for the validation
     error_message = Column(Text, nullable=True)
     is_active = Column(Boolean, default=True)
     
     # Relationships
-    data_mapping_id = Column(UUID(as_uuid=True), nullable=False)
+    data_mapping_id = Column(UUID(as_uuid=True), ForeignKey("data_mappings.id", ondelete="CASCADE"), nullable=False, index=True)
     data_mapping = relationship("DataMapping", back_populates="validation_rules")
     
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -114,32 +125,47 @@ class SyncLog(Base):
     """Data synchronization log model"""
     
     __tablename__ = "sync_logs"
-    
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    __table_args__ = (
+        Index("ix_sync_logs_error_details_gin", "error_details", postgresql_using="gin", postgresql_ops={"error_details": "jsonb_path_ops"}),
+        Index("ix_sync_logs_external_system_id_started_at", "external_system_id", "started_at"),
+        # Append-only log, range-partitioned by start time (partition key must be in the PK)
+        {"postgresql_partition_by": "RANGE (started_at)"},
+    )
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     external_system_id = Column(UUID(as_uuid=True), nullable=False)
     sync_type = Column(String(50), nullable=False)  # e.g., "full", "incremental", "real-time"
     status = Column(String(20), nullable=False)  # success, error, partial
-    records_processed = Column(String(20), nullable=True)
-    records_success = Column(String(20), nullable=True)
-    records_failed = Column(String(20), nullable=True)
-    error_details = Column(JSON, nullable=True)
+    records_processed = Column(Integer, nullable=True)
+    records_success = Column(Integer, nullable=True)
+    records_failed = Column(Integer, nullable=True)
+    error_details = Column(JSONB, nullable=True)
     
-    started_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
     
     def __repr__(self) -> str:
         return f"<SyncLog(id={self.id}, system_id={self.external_system_id}, status={self.status})>"
 
 
+# A partitioned table rejects rows until a partition exists; the default partition
+# catches anything outside the monthly partitions managed by ops (e.g. pg_partman)
+event.listen(
+    SyncLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE sync_logs_default PARTITION OF sync_logs DEFAULT").execute_if(dialect="postgresql"),
+)
+
+
 class APICredential(Base):
     """API credential storage model"""
     
     __tablename__ = "api_credentials"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     system_name = Column(String(100), nullable=False)
     credential_type = Column(String(50), nullable=False)  # e.g., "api_key", "oauth", "basic_auth"
-    encrypted_credentials = Column(Text, nullable=False)  # Encrypted credential data
+    encrypted_credentials = Column(LargeBinary, nullable=False)  # Raw ciphertext bytes (BYTEA), no base64 text encoding
     is_active = Column(Boolean, default=True)
     expires_at = Column(DateTime, nullable=True)
     
@@ -1,33 +1,52 @@
 """Context manager for handling agent execution contexts and state."""
 
-from typing import Any, Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
 import asyncio
+from collections import Counter
+from contextlib import AsyncExitStack, asynccontextmanager
+from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
+import orjson
+import redis.asyncio as aioredis
+
 from ai_financial.models.agent_models import AgentContext, AgentState, WorkflowState
 from ai_financial.core.config import settings
+from ai_financial.core.database import get_redis
 from ai_financial.core.logging import get_logger, get_tracer
 
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
 
+# Redis keys: serialized contexts (expiring after the context TTL), their locks,
+# and one hash of JSON-encoded values per company for shared state
+_CONTEXT_KEY = "ctx:{}"
+_CONTEXT_LOCK_KEY = "ctx-lock:{}"
+_SHARED_STATE_KEY = "shared:{}"
+_CONTEXT_LOCK_TIMEOUT_SECONDS = 30
+# In-process lock stripes (power of two) queuing local writers ahead of the Redis lock
+_LOCK_STRIPES = 256
+_SCAN_BATCH = 500
+
 
 class ContextManager:
     """Manager for agent execution contexts and shared state."""
     
-    def __init__(self):
-        """Initialize context manager."""
-        self.active_contexts: Dict[str, AgentContext] = {}
-        self.shared_state: Dict[str, Dict[str, Any]] = {}  # company_id -> shared data
-        self.context_locks: Dict[str, asyncio.Lock] = {}
+    def __init__(self, redis_client: Optional[aioredis.Redis] = None):
+        """Initialize context manager.
+        
+        Active contexts and company shared state live in Redis so every worker
+        sees the same data; Redis expires contexts after ``context_ttl_minutes``.
         
-        # Context cleanup settings
-        self.context_ttl_minutes = 60  # Context time-to-live
-        self.cleanup_interval_minutes = 10
+        Args:
+            redis_client: Async Redis client (defaults to the shared client)
+        """
+        self._redis = redis_client or get_redis()
+        self._local_locks = [asyncio.Lock() for _ in range(_LOCK_STRIPES)]
         
-        # Start cleanup task
-        self._cleanup_task: Optional[asyncio.Task] = None
+        # Context time-to-live
+        self.context_ttl_minutes = 60
         
         logger.info("Context Manager initialized")
     
@@ -67,14 +86,7 @@ class ContextManager:
             )
             
             # Store context
-            self.active_contexts[session_id] = context
-            
-            # Initialize company shared state if needed
-            if company_id not in self.shared_state:
-                self.shared_state[company_id] = {}
-            
-            # Create lock for this context
-            self.context_locks[session_id] = asyncio.Lock()
+            await self._store_context(context)
             
             logger.info(
                 "Context created",
@@ -89,13 +101,16 @@ class ContextManager:
     async def get_context(self, session_id: str) -> Optional[AgentContext]:
         """Get an existing context by session ID.
         
+        The result is a snapshot; use ``update_context_state`` to change it.
+        
         Args:
             session_id: Session identifier
             
         Returns:
             Agent context if found
         """
-        return self.active_contexts.get(session_id)
+        raw = await self._redis.get(_CONTEXT_KEY.format(session_id))
+        return AgentContext.model_validate_json(raw) if raw is not None else None
     
     async def update_context_state(
         self,
@@ -114,18 +129,20 @@ class ContextManager:
             True if context was updated
         """
         with tracer.start_as_current_span("context_manager.update_context_state"):
-            if session_id not in self.active_contexts:
-                return False
-            
-            # Use lock to ensure thread safety
-            async with self.context_locks.get(session_id, asyncio.Lock()):
-                context = self.active_contexts[session_id]
+            # Lock is held in Redis so concurrent workers serialize the read-modify-write
+            async with self._lock(session_id):
+                context = await self.get_context(session_id)
+                if context is None:
+                    return False
                 
                 if merge:
                     context.state.update(state_updates)
                 else:
                     context.state = state_updates.copy()
                 
+                if not await self._store_context(context, keep_ttl=True):
+                    return False
+                
                 logger.debug(
                     "Context state updated",
                     session_id=session_id,
@@ -148,15 +165,14 @@ class ContextManager:
         Returns:
             Shared state data
         """
-        if company_id not in self.shared_state:
-            return None if key else {}
-        
-        company_state = self.shared_state[company_id]
+        shared_key = _SHARED_STATE_KEY.format(company_id)
         
         if key:
-            return company_state.get(key)
+            raw = await self._redis.hget(shared_key, key)
+            return orjson.loads(raw) if raw is not None else None
         else:
-            return company_state.copy()
+            company_state = await self._redis.hgetall(shared_key)
+            return {field: orjson.loads(raw) for field, raw in company_state.items()}
     
     async def update_shared_state(
         self,
@@ -169,13 +185,14 @@ class ContextManager:
         Args:
             company_id: Company identifier
             key: State key
-            value: State value
+            value: State value (JSON-encoded; unsupported types are stored as strings)
         """
         with tracer.start_as_current_span("context_manager.update_shared_state"):
-            if company_id not in self.shared_state:
-                self.shared_state[company_id] = {}
-            
-            self.shared_state[company_id][key] = value
+            await self._redis.hset(
+                _SHARED_STATE_KEY.format(company_id),
+                key,
+                orjson.dumps(value, default=str),
+            )
             
             logger.debug(
                 "Shared state updated",
@@ -200,26 +217,24 @@ class ContextManager:
             True if data was shared successfully
         """
         with tracer.start_as_current_span("context_manager.share_context_data"):
-            source_context = self.active_contexts.get(source_session_id)
-            target_context = self.active_contexts.get(target_session_id)
-            
-            if not source_context or not target_context:
-                return False
-            
-            # Use locks to ensure thread safety
-            source_lock = self.context_locks.get(source_session_id, asyncio.Lock())
-            target_lock = self.context_locks.get(target_session_id, asyncio.Lock())
-            
-            async with source_lock:
-                async with target_lock:
-                    if keys:
-                        # Share specific keys
-                        for key in keys:
-                            if key in source_context.state:
-                                target_context.state[key] = source_context.state[key]
-                    else:
-                        # Share all state
-                        target_context.state.update(source_context.state)
+            async with self._lock(source_session_id, target_session_id):
+                source_context = await self.get_context(source_session_id)
+                target_context = await self.get_context(target_session_id)
+                
+                if not source_context or not target_context:
+                    return False
+                
+                if keys:
+                    # Share specific keys
+                    for key in keys:
+                        if key in source_context.state:
+                            target_context.state[key] = source_context.state[key]
+                else:
+                    # Share all state
+                    target_context.state.update(source_context.state)
+                
+                if not await self._store_context(target_context, keep_ttl=True):
+                    return False
             
             logger.info(
                 "Context data shared",
@@ -275,8 +290,7 @@ class ContextManager:
             })
             
             # Store context
-            self.active_contexts[context.session_id] = context
-            self.context_locks[context.session_id] = asyncio.Lock()
+            await self._store_context(context)
             
             logger.info(
                 "Workflow context created",
@@ -295,15 +309,9 @@ class ContextManager:
         Returns:
             True if context was cleaned up
         """
-        if session_id not in self.active_contexts:
+        if not await self._redis.delete(_CONTEXT_KEY.format(session_id)):
             return False
         
-        # Remove context and lock
-        del self.active_contexts[session_id]
-        
-        if session_id in self.context_locks:
-            del self.context_locks[session_id]
-        
         logger.info(
             "Context cleaned up",
             session_id=session_id,
@@ -311,117 +319,133 @@ class ContextManager:
         
         return True
     
-    async def cleanup_expired_contexts(self) -> int:
-        """Clean up expired contexts.
-        
-        Returns:
-            Number of contexts cleaned up
-        """
-        with tracer.start_as_current_span("context_manager.cleanup_expired_contexts"):
-            current_time = datetime.utcnow()
-            expired_sessions = []
-            
-            for session_id, context in self.active_contexts.items():
-                # Check if context has expired
-                age = current_time - context.created_at
-                if age > timedelta(minutes=self.context_ttl_minutes):
-                    expired_sessions.append(session_id)
-            
-            # Clean up expired contexts
-            cleanup_count = 0
-            for session_id in expired_sessions:
-                if await self.cleanup_context(session_id):
-                    cleanup_count += 1
-            
-            if cleanup_count > 0:
-                logger.info(
-                    "Expired contexts cleaned up",
-                    cleanup_count=cleanup_count,
-                )
-            
-            return cleanup_count
-    
     async def get_context_statistics(self) -> Dict[str, Any]:
         """Get context manager statistics.
         
         Returns:
             Statistics dictionary
         """
-        current_time = datetime.utcnow()
-        
-        # Calculate context age statistics
-        context_ages = []
-        company_counts = {}
-        agent_counts = {}
+        current_time = np.datetime64(datetime.utcnow(), "us")
+        contexts = await self._load_all_context_data()
+        shared_state_keys = [key async for key in self._scan_keys(_SHARED_STATE_KEY.format("*"))]
         
-        for context in self.active_contexts.values():
-            age_minutes = (current_time - context.created_at).total_seconds() / 60
-            context_ages.append(age_minutes)
-            
-            # Count by company
-            company_counts[context.company_id] = company_counts.get(context.company_id, 0) + 1
-            
-            # Count by agent
-            agent_counts[context.agent_id] = agent_counts.get(context.agent_id, 0) + 1
+        # Context ages in minutes, computed in one vectorized pass straight from the ISO timestamps
+        created_at = np.array([context["created_at"] for context in contexts], dtype="datetime64[us]")
+        context_ages = (current_time - created_at) / np.timedelta64(1, "m")
         
         return {
-            "active_contexts": len(self.active_contexts),
-            "shared_state_companies": len(self.shared_state),
-            "average_context_age_minutes": sum(context_ages) / len(context_ages) if context_ages else 0,
-            "oldest_context_age_minutes": max(context_ages) if context_ages else 0,
-            "contexts_by_company": company_counts,
-            "contexts_by_agent": agent_counts,
+            "active_contexts": len(contexts),
+            "shared_state_companies": len(shared_state_keys),
+            "average_context_age_minutes": float(context_ages.mean()) if len(contexts) else 0,
+            "oldest_context_age_minutes": float(context_ages.max()) if len(contexts) else 0,
+            "contexts_by_company": dict(Counter(context["company_id"] for context in contexts)),
+            "contexts_by_agent": dict(Counter(context["agent_id"] for context in contexts)),
             "context_ttl_minutes": self.context_ttl_minutes,
         }
     
-    async def start_cleanup_task(self) -> None:
-        """Start the periodic cleanup task."""
-        if self._cleanup_task and not self._cleanup_task.done():
-            return
-        
-        self._cleanup_task = asyncio.create_task(self._periodic_cleanup())
-        logger.info("Context cleanup task started")
-    
-    async def stop_cleanup_task(self) -> None:
-        """Stop the periodic cleanup task."""
-        if self._cleanup_task and not self._cleanup_task.done():
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-        
-        logger.info("Context cleanup task stopped")
-    
-    async def _periodic_cleanup(self) -> None:
-        """Periodic cleanup task."""
-        while True:
-            try:
-                await asyncio.sleep(self.cleanup_interval_minutes * 60)
-                await self.cleanup_expired_contexts()
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(
-                    "Context cleanup task error",
-                    error=str(e),
-                )
-    
     async def clear_all_contexts(self) -> int:
         """Clear all active contexts (for testing/shutdown).
         
         Returns:
             Number of contexts cleared
         """
-        count = len(self.active_contexts)
-        
-        self.active_contexts.clear()
-        self.context_locks.clear()
-        self.shared_state.clear()
+        count = await self._delete_keys(_CONTEXT_KEY.format("*"))
+        await self._delete_keys(_SHARED_STATE_KEY.format("*"))
         
         logger.info(
             "All contexts cleared",
             cleared_count=count,
         )
         
-        return count
\ No newline at end of file
+        return count
+    
+    async def _store_context(self, context: AgentContext, keep_ttl: bool = False) -> bool:
+        """Write a context to Redis.
+        
+        Args:
+            context: Context to store
+            keep_ttl: Overwrite an existing context, keeping its remaining TTL
+            
+        Returns:
+            True if the context was written (False if it expired meanwhile)
+        """
+        key = _CONTEXT_KEY.format(context.session_id)
+        payload = context.model_dump_json()
+        
+        if keep_ttl:
+            written = await self._redis.set(key, payload, keepttl=True, xx=True)
+        else:
+            written = await self._redis.set(key, payload, ex=self.context_ttl_minutes * 60)
+        
+        return bool(written)
+    
+    @asynccontextmanager
+    async def _lock(self, *session_ids: str) -> AsyncIterator[None]:
+        """Hold the locks guarding one or more contexts.
+        
+        Writers in this process first queue on a striped local lock, so only one
+        of them at a time polls the cross-process Redis lock. Both kinds are
+        taken once each, in a fixed order, so overlapping callers cannot deadlock.
+        
+        Args:
+            session_ids: Session identifiers
+        """
+        session_ids = sorted(set(session_ids))
+        stripes = sorted({hash(session_id) & (_LOCK_STRIPES - 1) for session_id in session_ids})
+        
+        async with AsyncExitStack() as stack:
+            for stripe in stripes:
+                await stack.enter_async_context(self._local_locks[stripe])
+            for session_id in session_ids:
+                await stack.enter_async_context(
+                    self._redis.lock(
+                        _CONTEXT_LOCK_KEY.format(session_id),
+                        timeout=_CONTEXT_LOCK_TIMEOUT_SECONDS,
+                    )
+                )
+            yield
+    
+    async def _scan_keys(self, pattern: str) -> AsyncIterator[str]:
+        """Iterate over the Redis keys matching ``pattern``.
+        
+        Args:
+            pattern: Glob-style key pattern
+        """
+        async for key in self._redis.scan_iter(match=pattern, count=_SCAN_BATCH):
+            yield key
+    
+    async def _delete_keys(self, pattern: str) -> int:
+        """Delete every Redis key matching ``pattern``.
+        
+        Args:
+            pattern: Glob-style key pattern
+            
+        Returns:
+            Number of keys deleted
+        """
+        keys = [key async for key in self._scan_keys(pattern)]
+        count = 0
+        
+        for start in range(0, len(keys), _SCAN_BATCH):
+            count += await self._redis.delete(*keys[start:start + _SCAN_BATCH])
+        
+        return count
+    
+    async def _load_all_context_data(self) -> List[Dict[str, Any]]:
+        """Load every active context from Redis as plain decoded JSON.
+        
+        Skips model validation, so no datetime objects are built per context.
+        
+        Returns:
+            List of active context payloads
+        """
+        keys = [key async for key in self._scan_keys(_CONTEXT_KEY.format("*"))]
+        contexts = []
+        
+        for start in range(0, len(keys), _SCAN_BATCH):
+            for raw in await self._redis.mget(keys[start:start + _SCAN_BATCH]):
+                # Keys can expire between SCAN and MGET
+                if raw is not None:
+                    contexts.append(orjson.loads(raw))
+        
+        return contexts
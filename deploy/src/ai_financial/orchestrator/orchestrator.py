@@ -9,7 +9,7 @@ from ai_financial.core.base_agent import BaseAgent
 from ai_financial.core.config import settings
 from ai_financial.core.logging import get_logger, get_tracer
 from ai_financial.models.agent_models import AgentContext, AgentState, WorkflowState, AgentStatus
-from ai_financial.mcp.hub import get_tool_hub
+from ai_financial.mcp.hub import ToolHub, get_tool_hub
 from ai_financial.orchestrator.workflow_engine import WorkflowEngine
 from ai_financial.orchestrator.context_manager import ContextManager
 
@@ -28,7 +28,6 @@ class AgentOrchestrator:
         # Core components
         self.workflow_engine = WorkflowEngine()
         self.context_manager = ContextManager()
-        self.tool_hub = get_tool_hub()
         
         # Orchestrator state
         self._running = False
@@ -40,6 +39,11 @@ class AgentOrchestrator:
             max_concurrent_agents=self._max_concurrent_agents,
         )
     
+    @property
+    def tool_hub(self) -> ToolHub:
+        """Tool hub, resolved lazily so the orchestrator does not build it at import."""
+        return get_tool_hub()
+    
     def register_agent(self, agent: BaseAgent) -> None:
         """Register an agent with the orchestrator.
         
@@ -1,12 +1,22 @@
 """Workflow engine for managing complex multi-agent workflows."""
 
-from typing import Any, Dict, List, Optional, Callable
-from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Callable, Tuple
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
 import asyncio
+import hashlib
+import time
+
+import orjson
+from opentelemetry import trace
 
 from ai_financial.models.agent_models import WorkflowState, AgentStatus, ApprovalRequest
-from ai_financial.core.logging import get_logger, get_tracer
+from ai_financial.core.config import settings
+from ai_financial.core.logging import get_logger, get_tracer, maybe_span
 
 logger = get_logger(__name__)
 tracer = get_tracer(__name__)
@@ -21,75 +31,86 @@ class WorkflowStepType(str, Enum):
     SEQUENTIAL = "sequential"
 
 
+# Timeout for agent steps that do not set timeout_minutes
+_DEFAULT_STEP_TIMEOUT_MINUTES = 15
+# Canonical JSON encoding for agent requests and step cache keys
+_JSON_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+class _StepFailed(Exception):
+    """Raised inside a step wave to cancel the remaining steps."""
+
+
+@dataclass(slots=True, eq=False)
 class WorkflowStep:
-    """Individual workflow step definition."""
+    """Individual workflow step definition.
     
-    def __init__(
-        self,
-        step_id: str,
-        step_type: WorkflowStepType,
-        name: str,
-        description: str,
-        agent_id: Optional[str] = None,
-        parameters: Optional[Dict[str, Any]] = None,
-        conditions: Optional[Dict[str, Any]] = None,
-        timeout_minutes: Optional[int] = None,
-    ):
-        """Initialize workflow step.
-        
-        Args:
-            step_id: Unique step identifier
-            step_type: Type of step
-            name: Step name
-            description: Step description
-            agent_id: Agent to execute step (for agent tasks)
-            parameters: Step parameters
-            conditions: Execution conditions
-            timeout_minutes: Step timeout in minutes
-        """
-        self.step_id = step_id
-        self.step_type = step_type
-        self.name = name
-        self.description = description
-        self.agent_id = agent_id
-        self.parameters = parameters or {}
-        self.conditions = conditions or {}
-        self.timeout_minutes = timeout_minutes
-        
-        # Execution state
-        self.status = AgentStatus.IDLE
-        self.result: Optional[Dict[str, Any]] = None
-        self.error: Optional[str] = None
-        self.started_at: Optional[datetime] = None
-        self.completed_at: Optional[datetime] = None
+    Steps belong to definitions shared by every run (and every engine), so
+    they hold no per-run execution state; outcomes are returned per run.
+    
+    Attributes:
+        step_id: Unique step identifier
+        step_type: Type of step
+        name: Step name
+        description: Step description
+        agent_id: Agent to execute step (for agent tasks)
+        parameters: Step parameters
+        conditions: Execution conditions
+        timeout_minutes: Step timeout in minutes
+        cacheable: Whether an identical earlier result may be reused (opt-in,
+            only for read-only steps without side effects)
+    """
+    
+    step_id: str
+    step_type: WorkflowStepType
+    name: str
+    description: str
+    agent_id: Optional[str] = None
+    parameters: Dict[str, Any] = field(default_factory=dict)
+    conditions: Dict[str, Any] = field(default_factory=dict)
+    timeout_minutes: Optional[int] = None
+    cacheable: bool = False
+    
+    # Static part of every agent request, built once (parameters are treated as immutable)
+    request_template: Mapping[str, Any] = field(init=False, repr=False)
+    request_template_json: bytes = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Precompute the static agent request fields."""
+        self.request_template = MappingProxyType({
+            "step_name": self.name,
+            "step_description": self.description,
+            "parameters": self.parameters,
+        })
+        self.request_template_json = orjson.dumps(
+            dict(self.request_template),
+            default=str,
+            option=_JSON_OPTIONS,
+        )
 
 
+@dataclass(slots=True, eq=False)
 class WorkflowDefinition:
-    """Workflow definition with steps and flow control."""
+    """Workflow definition with steps and flow control.
     
-    def __init__(
-        self,
-        workflow_id: str,
-        name: str,
-        description: str,
-        workflow_type: str,
-    ):
-        """Initialize workflow definition.
-        
-        Args:
-            workflow_id: Unique workflow identifier
-            name: Workflow name
-            description: Workflow description
-            workflow_type: Type of workflow
-        """
-        self.workflow_id = workflow_id
-        self.name = name
-        self.description = description
-        self.workflow_type = workflow_type
-        
-        self.steps: Dict[str, WorkflowStep] = {}
-        self.step_order: List[str] = []
-        self.dependencies: Dict[str, List[str]] = {}  # step_id -> list of prerequisite step_ids
+    Attributes:
+        workflow_id: Unique workflow identifier
+        name: Workflow name
+        description: Workflow description
+        workflow_type: Type of workflow
+    """
+    
+    workflow_id: str
+    name: str
+    description: str
+    workflow_type: str
+    
+    steps: Dict[str, WorkflowStep] = field(default_factory=dict, init=False)
+    step_order: List[str] = field(default_factory=list, init=False)
+    dependencies: Dict[str, List[str]] = field(default_factory=dict, init=False)  # step_id -> list of prerequisite step_ids
+    _dependents: Dict[str, List[str]] = field(default_factory=dict, init=False)  # step_id -> list of steps waiting on it
+    _step_bits: Dict[str, int] = field(default_factory=dict, init=False)  # step_id -> single-bit mask
+    _schedule: List[Tuple[WorkflowStep, int, int]] = field(default_factory=list, init=False)  # (step, bit, prerequisite mask) in step order
         
     def add_step(self, step: WorkflowStep, dependencies: Optional[List[str]] = None) -> None:
         """Add a step to the workflow.
@@ -100,9 +121,29 @@ class WorkflowDefinition:
         """
         self.steps[step.step_id] = step
         self.step_order.append(step.step_id)
+        dependency_mask = 0
         
         if dependencies:
             self.dependencies[step.step_id] = dependencies
+            for dependency in dependencies:
+                self._dependents.setdefault(dependency, []).append(step.step_id)
+                dependency_mask |= self._step_bit(dependency)
+        
+        self._schedule.append((step, self._step_bit(step.step_id), dependency_mask))
+    
+    def _step_bit(self, step_id: str) -> int:
+        """Get the bit representing a step, assigning the next free one on first use.
+        
+        Args:
+            step_id: Step identifier (may be a prerequisite not added yet)
+            
+        Returns:
+            Single-bit mask for the step
+        """
+        bit = self._step_bits.get(step_id)
+        if bit is None:
+            bit = self._step_bits[step_id] = 1 << len(self._step_bits)
+        return bit
     
     def get_ready_steps(self, completed_steps: List[str]) -> List[WorkflowStep]:
         """Get steps that are ready to execute.
@@ -113,27 +154,205 @@ class WorkflowDefinition:
         Returns:
             List of steps ready for execution
         """
-        ready_steps = []
+        completed_mask = 0
+        for step_id in completed_steps:
+            completed_mask |= self._step_bits.get(step_id, 0)
+        
+        # A step is ready when it is not done and all its prerequisite bits are set
+        return [
+            step
+            for step, bit, dependency_mask in self._schedule
+            if not completed_mask & bit and completed_mask & dependency_mask == dependency_mask
+        ]
+    
+    def get_pending_dependency_counts(self, completed_steps: List[str]) -> Dict[str, int]:
+        """Count the unfinished prerequisites of every step not yet completed.
+        
+        Args:
+            completed_steps: List of completed step IDs
+            
+        Returns:
+            Mapping of step ID to number of unfinished prerequisites, in step order
+        """
+        completed = set(completed_steps)
+        
+        return {
+            step_id: sum(dep not in completed for dep in self.dependencies.get(step_id, ()))
+            for step_id in self.step_order
+            if step_id not in completed
+        }
+    
+    def release_dependents(
+        self,
+        completed_step_ids: List[str],
+        pending: Dict[str, int],
+    ) -> List[WorkflowStep]:
+        """Mark steps completed and get the dependents they unblock.
+        
+        Only the dependents of the given steps are visited, so scheduling a
+        whole workflow this way touches each dependency edge once.
         
-        for step_id in self.step_order:
-            if step_id in completed_steps:
-                continue
+        Args:
+            completed_step_ids: Steps that just completed
+            pending: Counts from get_pending_dependency_counts, updated in place
             
-            # Check if all dependencies are completed
-            dependencies = self.dependencies.get(step_id, [])
-            if all(dep in completed_steps for dep in dependencies):
-                ready_steps.append(self.steps[step_id])
+        Returns:
+            Steps whose last prerequisite just completed
+        """
+        ready_steps = []
+        
+        for step_id in completed_step_ids:
+            for dependent_id in self._dependents.get(step_id, ()):
+                pending[dependent_id] -= 1
+                if pending[dependent_id] == 0:
+                    ready_steps.append(self.steps[dependent_id])
         
         return ready_steps
 
 
+@lru_cache(maxsize=1)
+def _build_advisory_workflow() -> WorkflowDefinition:
+    """Build the built-in advisory workflow (once per process)."""
+    advisory_workflow = WorkflowDefinition(
+        workflow_id="advisory_ceo_support",
+        name="CEO Advisory Workflow",
+        description="Complete advisory workflow for CEO decision support",
+        workflow_type="advisory",
+    )
+    
+    # Add advisory workflow steps
+    advisory_workflow.add_step(WorkflowStep(
+        step_id="data_sync",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Data Synchronization",
+        description="Sync latest financial data from all sources",
+        agent_id="data_sync_agent",
+        timeout_minutes=10,
+    ))
+    
+    advisory_workflow.add_step(WorkflowStep(
+        step_id="financial_analysis",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Financial Analysis",
+        description="Perform comprehensive financial analysis",
+        agent_id="ai_cfo_agent",
+        timeout_minutes=15,
+        cacheable=True,
+    ), dependencies=["data_sync"])
+    
+    advisory_workflow.add_step(WorkflowStep(
+        step_id="forecasting",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Financial Forecasting",
+        description="Generate financial forecasts and projections",
+        agent_id="forecasting_agent",
+        timeout_minutes=20,
+        cacheable=True,
+    ), dependencies=["financial_analysis"])
+    
+    advisory_workflow.add_step(WorkflowStep(
+        step_id="risk_assessment",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Risk Assessment",
+        description="Assess financial risks and opportunities",
+        agent_id="alert_agent",
+        timeout_minutes=10,
+        cacheable=True,
+    ), dependencies=["financial_analysis"])
+    
+    advisory_workflow.add_step(WorkflowStep(
+        step_id="executive_reporting",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Executive Reporting",
+        description="Generate executive summary and recommendations",
+        agent_id="reporting_agent",
+        timeout_minutes=15,
+    ), dependencies=["forecasting", "risk_assessment"])
+    
+    return advisory_workflow
+
+
+@lru_cache(maxsize=1)
+def _build_transactional_workflow() -> WorkflowDefinition:
+    """Build the built-in transactional workflow (once per process)."""
+    transactional_workflow = WorkflowDefinition(
+        workflow_id="transactional_automation",
+        name="Transactional Automation Workflow",
+        description="Complete transactional processing workflow",
+        workflow_type="transactional",
+    )
+    
+    # Add transactional workflow steps
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="document_processing",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Document Processing",
+        description="OCR and document data extraction",
+        agent_id="ocr_agent",
+        timeout_minutes=5,
+    ))
+    
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="data_standardization",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Data Standardization",
+        description="Standardize and validate extracted data",
+        agent_id="data_sync_agent",
+        timeout_minutes=5,
+        cacheable=True,
+    ), dependencies=["document_processing"])
+    
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="accounting_entries",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Accounting Entries",
+        description="Create automated accounting entries",
+        agent_id="accounting_agent",
+        timeout_minutes=10,
+    ), dependencies=["data_standardization"])
+    
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="approval_check",
+        step_type=WorkflowStepType.APPROVAL,
+        name="Transaction Approval",
+        description="Human approval for high-value transactions",
+        timeout_minutes=60,
+    ), dependencies=["accounting_entries"])
+    
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="reconciliation",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Bank Reconciliation",
+        description="Reconcile transactions with bank statements",
+        agent_id="reconciliation_agent",
+        timeout_minutes=15,
+    ), dependencies=["approval_check"])
+    
+    transactional_workflow.add_step(WorkflowStep(
+        step_id="compliance_audit",
+        step_type=WorkflowStepType.AGENT_TASK,
+        name="Compliance Audit",
+        description="Validate compliance and create audit trail",
+        agent_id="compliance_agent",
+        timeout_minutes=10,
+    ), dependencies=["reconciliation"])
+    
+    return transactional_workflow
+
+
 class WorkflowEngine:
     """Engine for executing complex workflows."""
     
     def __init__(self):
         """Initialize workflow engine."""
         self.workflow_definitions: Dict[str, WorkflowDefinition] = {}
+        # Copy-on-write: replaced (never mutated) on every change, so readers can
+        # share it as a stable snapshot without copying or locking
         self.active_executions: Dict[str, WorkflowState] = {}
+        self._step_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._agent_slots: Dict[Optional[str], asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(settings.workflow.max_parallel_steps_per_agent)
+        )
         
         # Initialize built-in workflow definitions
         self._initialize_builtin_workflows()
@@ -142,131 +361,16 @@ class WorkflowEngine:
     
     def _initialize_builtin_workflows(self) -> None:
         """Initialize built-in workflow definitions."""
-        # Advisory workflow
-        advisory_workflow = WorkflowDefinition(
-            workflow_id="advisory_ceo_support",
-            name="CEO Advisory Workflow",
-            description="Complete advisory workflow for CEO decision support",
-            workflow_type="advisory",
-        )
-        
-        # Add advisory workflow steps
-        advisory_workflow.add_step(WorkflowStep(
-            step_id="data_sync",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Data Synchronization",
-            description="Sync latest financial data from all sources",
-            agent_id="data_sync_agent",
-            timeout_minutes=10,
-        ))
-        
-        advisory_workflow.add_step(WorkflowStep(
-            step_id="financial_analysis",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Financial Analysis",
-            description="Perform comprehensive financial analysis",
-            agent_id="ai_cfo_agent",
-            timeout_minutes=15,
-        ), dependencies=["data_sync"])
-        
-        advisory_workflow.add_step(WorkflowStep(
-            step_id="forecasting",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Financial Forecasting",
-            description="Generate financial forecasts and projections",
-            agent_id="forecasting_agent",
-            timeout_minutes=20,
-        ), dependencies=["financial_analysis"])
-        
-        advisory_workflow.add_step(WorkflowStep(
-            step_id="risk_assessment",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Risk Assessment",
-            description="Assess financial risks and opportunities",
-            agent_id="alert_agent",
-            timeout_minutes=10,
-        ), dependencies=["financial_analysis"])
-        
-        advisory_workflow.add_step(WorkflowStep(
-            step_id="executive_reporting",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Executive Reporting",
-            description="Generate executive summary and recommendations",
-            agent_id="reporting_agent",
-            timeout_minutes=15,
-        ), dependencies=["forecasting", "risk_assessment"])
-        
-        self.workflow_definitions["advisory"] = advisory_workflow
-        
-        # Transactional workflow
-        transactional_workflow = WorkflowDefinition(
-            workflow_id="transactional_automation",
-            name="Transactional Automation Workflow",
-            description="Complete transactional processing workflow",
-            workflow_type="transactional",
-        )
-        
-        # Add transactional workflow steps
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="document_processing",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Document Processing",
-            description="OCR and document data extraction",
-            agent_id="ocr_agent",
-            timeout_minutes=5,
-        ))
-        
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="data_standardization",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Data Standardization",
-            description="Standardize and validate extracted data",
-            agent_id="data_sync_agent",
-            timeout_minutes=5,
-        ), dependencies=["document_processing"])
-        
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="accounting_entries",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Accounting Entries",
-            description="Create automated accounting entries",
-            agent_id="accounting_agent",
-            timeout_minutes=10,
-        ), dependencies=["data_standardization"])
-        
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="approval_check",
-            step_type=WorkflowStepType.APPROVAL,
-            name="Transaction Approval",
-            description="Human approval for high-value transactions",
-            timeout_minutes=60,
-        ), dependencies=["accounting_entries"])
-        
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="reconciliation",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Bank Reconciliation",
-            description="Reconcile transactions with bank statements",
-            agent_id="reconciliation_agent",
-            timeout_minutes=15,
-        ), dependencies=["approval_check"])
-        
-        transactional_workflow.add_step(WorkflowStep(
-            step_id="compliance_audit",
-            step_type=WorkflowStepType.AGENT_TASK,
-            name="Compliance Audit",
-            description="Validate compliance and create audit trail",
-            agent_id="compliance_agent",
-            timeout_minutes=10,
-        ), dependencies=["reconciliation"])
-        
-        self.workflow_definitions["transactional"] = transactional_workflow
+        # Built once and shared by every engine instance
+        self.workflow_definitions["advisory"] = _build_advisory_workflow()
+        self.workflow_definitions["transactional"] = _build_transactional_workflow()
     
     async def execute_workflow(
         self,
         workflow_type: str,
         workflow_state: WorkflowState,
         agent_executor: Callable[[str, Any, Any], Any],
+        encode_requests: bool = False,
     ) -> Dict[str, Any]:
         """Execute a workflow.
         
@@ -274,6 +378,8 @@ class WorkflowEngine:
             workflow_type: Type of workflow to execute
             workflow_state: Workflow state
             agent_executor: Function to execute agent tasks
+            encode_requests: Pass agent requests to the executor as orjson-encoded
+                bytes instead of dicts, for backends that send them on as JSON
             
         Returns:
             Workflow execution result
@@ -289,82 +395,98 @@ class WorkflowEngine:
                 }
             
             workflow_def = self.workflow_definitions[workflow_type]
-            self.active_executions[workflow_state.workflow_id] = workflow_state
+            started = time.monotonic()
             
-            try:
-                workflow_state.set_status(AgentStatus.PROCESSING)
-                
-                # Execute workflow steps
-                while True:
-                    # Get ready steps
+            with self._track_execution(workflow_state):
+                try:
+                    workflow_state.set_status(AgentStatus.PROCESSING)
+                    
+                    # Execute workflow steps level by level; results stay local to this run
+                    step_outcomes: Dict[str, Dict[str, Any]] = {}
+                    pending = workflow_def.get_pending_dependency_counts(workflow_state.steps_completed)
                     ready_steps = workflow_def.get_ready_steps(workflow_state.steps_completed)
                     
-                    if not ready_steps:
-                        # No more steps to execute
-                        break
+                    while ready_steps:
+                        # Execute ready steps (can be parallel)
+                        step_results = await self._execute_steps(
+                            ready_steps,
+                            workflow_state,
+                            agent_executor,
+                            encode_requests,
+                        )
+                        
+                        step_outcomes.update(step_results)
+                        
+                        # Process step results
+                        completed_step_ids = []
+                        for step_id, result in step_results.items():
+                            if result.get("success", False):
+                                workflow_state.complete_step(step_id)
+                                completed_step_ids.append(step_id)
+                            else:
+                                # Handle step failure
+                                error_msg = result.get("error", "Step execution failed")
+                                workflow_state.set_error(f"Step {step_id} failed: {error_msg}")
+                                
+                                return {
+                                    "success": False,
+                                    "error": workflow_state.error,
+                                    "workflow_id": workflow_state.workflow_id,
+                                    "failed_step": step_id,
+                                }
+                        
+                        # Only dependents of the steps just completed can become ready
+                        ready_steps = workflow_def.release_dependents(completed_step_ids, pending)
+                    
+                    # Workflow completed successfully
+                    workflow_state.set_status(AgentStatus.COMPLETED)
+                    
+                    return {
+                        "success": True,
+                        "workflow_id": workflow_state.workflow_id,
+                        "workflow_type": workflow_type,
+                        "completed_steps": workflow_state.steps_completed,
+                        "step_results": step_outcomes,
+                        "execution_time": time.monotonic() - started,
+                    }
                     
-                    # Execute ready steps (can be parallel)
-                    step_results = await self._execute_steps(
-                        ready_steps,
-                        workflow_state,
-                        agent_executor,
+                except Exception as e:
+                    logger.error(
+                        "Workflow execution failed",
+                        workflow_type=workflow_type,
+                        workflow_id=workflow_state.workflow_id,
+                        error=str(e),
                     )
                     
-                    # Process step results
-                    for step_id, result in step_results.items():
-                        if result.get("success", False):
-                            workflow_state.complete_step(step_id)
-                        else:
-                            # Handle step failure
-                            error_msg = result.get("error", "Step execution failed")
-                            workflow_state.set_error(f"Step {step_id} failed: {error_msg}")
-                            
-                            return {
-                                "success": False,
-                                "error": workflow_state.error,
-                                "workflow_id": workflow_state.workflow_id,
-                                "failed_step": step_id,
-                            }
-                
-                # Workflow completed successfully
-                workflow_state.set_status(AgentStatus.COMPLETED)
-                
-                return {
-                    "success": True,
-                    "workflow_id": workflow_state.workflow_id,
-                    "workflow_type": workflow_type,
-                    "completed_steps": workflow_state.steps_completed,
-                    "execution_time": (
-                        datetime.utcnow() - workflow_state.created_at
-                    ).total_seconds(),
-                }
-                
-            except Exception as e:
-                logger.error(
-                    "Workflow execution failed",
-                    workflow_type=workflow_type,
-                    workflow_id=workflow_state.workflow_id,
-                    error=str(e),
-                )
-                
-                workflow_state.set_error(f"Workflow execution failed: {str(e)}")
-                
-                return {
-                    "success": False,
-                    "error": workflow_state.error,
-                    "workflow_id": workflow_state.workflow_id,
-                }
-            
-            finally:
-                # Clean up
-                if workflow_state.workflow_id in self.active_executions:
-                    del self.active_executions[workflow_state.workflow_id]
+                    workflow_state.set_error(f"Workflow execution failed: {str(e)}")
+                    
+                    return {
+                        "success": False,
+                        "error": workflow_state.error,
+                        "workflow_id": workflow_state.workflow_id,
+                    }
+    
+    @contextmanager
+    def _track_execution(self, workflow_state: WorkflowState) -> Iterator[None]:
+        """Keep a workflow in active_executions while it runs.
+        
+        Args:
+            workflow_state: Workflow state
+        """
+        self.active_executions = {**self.active_executions, workflow_state.workflow_id: workflow_state}
+        try:
+            yield
+        finally:
+            remaining = dict(self.active_executions)
+            remaining.pop(workflow_state.workflow_id, None)
+            self.active_executions = remaining
     
     async def _execute_steps(
         self,
         steps: List[WorkflowStep],
         workflow_state: WorkflowState,
         agent_executor: Callable[[str, Any, Any], Any],
+        encode_requests: bool = False,
     ) -> Dict[str, Dict[str, Any]]:
         """Execute workflow steps.
         
@@ -372,42 +494,76 @@ class WorkflowEngine:
             steps: Steps to execute
             workflow_state: Workflow state
             agent_executor: Agent execution function
+            encode_requests: Pass agent requests as orjson-encoded bytes
             
         Returns:
             Step execution results
         """
-        results = {}
-        
-        # Execute steps (can be parallel for independent steps)
-        tasks = []
+        results: Dict[str, Dict[str, Any]] = {}
         
-        for step in steps:
-            if step.step_type == WorkflowStepType.AGENT_TASK:
-                task = self._execute_agent_step(step, workflow_state, agent_executor)
-                tasks.append((step.step_id, task))
+        # Execute steps (can be parallel for independent steps) under one span per wave
+        with maybe_span(tracer, "workflow_engine.execute_wave") as span:
+            span.set_attribute("step_ids", ",".join(step.step_id for step in steps))
             
-            elif step.step_type == WorkflowStepType.APPROVAL:
-                task = self._execute_approval_step(step, workflow_state)
-                tasks.append((step.step_id, task))
-        
-        # Wait for all tasks to complete
-        for step_id, task in tasks:
             try:
-                result = await task
-                results[step_id] = result
-            except Exception as e:
-                results[step_id] = {
-                    "success": False,
-                    "error": str(e),
-                }
+                async with asyncio.TaskGroup() as task_group:
+                    for step in steps:
+                        if step.step_type in (WorkflowStepType.AGENT_TASK, WorkflowStepType.APPROVAL):
+                            task_group.create_task(
+                                self._run_step(step, workflow_state, agent_executor, encode_requests, results)
+                            )
+            except* _StepFailed:
+                # A failed step ends the workflow, so the task group has already
+                # cancelled the rest of the wave; results holds the failure
+                pass
         
         return results
     
+    async def _run_step(
+        self,
+        step: WorkflowStep,
+        workflow_state: WorkflowState,
+        agent_executor: Callable[[str, Any, Any], Any],
+        encode_requests: bool,
+        results: Dict[str, Dict[str, Any]],
+    ) -> None:
+        """Run one step of a wave and record its result.
+        
+        Args:
+            step: Step to execute
+            workflow_state: Workflow state
+            agent_executor: Agent execution function
+            encode_requests: Pass agent requests as orjson-encoded bytes
+            results: Wave results, keyed by step ID
+            
+        Raises:
+            _StepFailed: If the step did not succeed
+        """
+        try:
+            if step.step_type == WorkflowStepType.AGENT_TASK:
+                # Cap in-flight calls per agent so a wide wave cannot flood one provider
+                async with self._agent_slots[step.agent_id]:
+                    result = await self._execute_agent_step(
+                        step, workflow_state, agent_executor, encode_requests
+                    )
+            else:
+                result = await self._execute_approval_step(step, workflow_state)
+        except Exception as e:
+            result = {
+                "success": False,
+                "error": str(e),
+            }
+        
+        results[step.step_id] = result
+        if not result.get("success", False):
+            raise _StepFailed(step.step_id)
+    
     async def _execute_agent_step(
         self,
         step: WorkflowStep,
         workflow_state: WorkflowState,
         agent_executor: Callable[[str, Any, Any], Any],
+        encode_requests: bool = False,
     ) -> Dict[str, Any]:
         """Execute an agent task step.
         
@@ -415,58 +571,80 @@ class WorkflowEngine:
             step: Workflow step
             workflow_state: Workflow state
             agent_executor: Agent execution function
+            encode_requests: Pass the request as orjson-encoded bytes
             
         Returns:
             Step execution result
         """
-        with tracer.start_as_current_span("workflow_engine.execute_agent_step") as span:
-            span.set_attribute("step_id", step.step_id)
-            span.set_attribute("agent_id", step.agent_id or "unknown")
+        # Recorded on the wave span rather than opening a span per step
+        trace.get_current_span().add_event(
+            "workflow_engine.agent_step",
+            {"step_id": step.step_id, "agent_id": step.agent_id or "unknown"},
+        )
+        
+        timeout_minutes = step.timeout_minutes or _DEFAULT_STEP_TIMEOUT_MINUTES
+        
+        try:
+            # Prepare step request; workflow data is encoded once, for the cache
+            # key and (when requested) spliced after the pre-encoded template
+            workflow_data_json = orjson.dumps(workflow_state.data, default=str, option=_JSON_OPTIONS)
+            if encode_requests:
+                request = step.request_template_json[:-1] + b',"workflow_data":' + workflow_data_json + b"}"
+            else:
+                request = {**step.request_template, "workflow_data": workflow_state.data}
             
-            try:
-                step.status = AgentStatus.PROCESSING
-                step.started_at = datetime.utcnow()
-                
-                # Prepare step request
-                request = {
-                    "step_name": step.name,
-                    "step_description": step.description,
-                    "parameters": step.parameters,
-                    "workflow_data": workflow_state.data,
-                }
-                
-                # Execute agent
-                result = await agent_executor(step.agent_id, request, workflow_state.context)
-                
-                step.status = AgentStatus.COMPLETED
-                step.completed_at = datetime.utcnow()
-                step.result = result
-                
-                logger.info(
-                    "Agent step completed",
-                    step_id=step.step_id,
-                    agent_id=step.agent_id,
-                    success=result.get("success", False),
-                )
-                
-                return result
-                
-            except Exception as e:
-                step.status = AgentStatus.ERROR
-                step.error = str(e)
-                step.completed_at = datetime.utcnow()
-                
-                logger.error(
-                    "Agent step failed",
-                    step_id=step.step_id,
-                    agent_id=step.agent_id,
-                    error=str(e),
+            # Execute agent, reusing a recent identical result when allowed; without
+            # a context there is no tenant to scope the entry to, so never cache
+            cache_key = (
+                self._step_cache_key(step, workflow_state, workflow_data_json)
+                if step.cacheable and workflow_state.context
+                else None
+            )
+            result = self._get_cached_step_result(cache_key) if cache_key else None
+            
+            if result is None:
+                result = await asyncio.wait_for(
+                    agent_executor(step.agent_id, request, workflow_state.context),
+                    timeout=timeout_minutes * 60,
                 )
-                
-                return {
-                    "success": False,
-                    "error": str(e),
-                }
+                if cache_key and result.get("success", False):
+                    self._cache_step_result(cache_key, result)
+            
+            logger.info(
+                "Agent step completed",
+                step_id=step.step_id,
+                agent_id=step.agent_id,
+                success=result.get("success", False),
+            )
+            
+            return result
+            
+        except asyncio.TimeoutError:
+            logger.error(
+                "Agent step timed out",
+                step_id=step.step_id,
+                agent_id=step.agent_id,
+                timeout_minutes=timeout_minutes,
+            )
+            
+            return {
+                "success": False,
+                "error": f"Step timed out after {timeout_minutes} minutes",
+                "timeout": True,
+            }
+            
+        except Exception as e:
+            logger.error(
+                "Agent step failed",
+                step_id=step.step_id,
+                agent_id=step.agent_id,
+                error=str(e),
+            )
+            
+            return {
+                "success": False,
+                "error": str(e),
+            }
     
     async def _execute_approval_step(
         self,
@@ -482,69 +660,114 @@ class WorkflowEngine:
         Returns:
             Step execution result
         """
-        with tracer.start_as_current_span("workflow_engine.execute_approval_step"):
-            try:
-                step.status = AgentStatus.WAITING
-                step.started_at = datetime.utcnow()
-                
-                # Create approval request
-                approval_request = workflow_state.add_approval_request(
-                    agent_id="workflow_engine",
-                    request_type="workflow_approval",
-                    description=step.description,
-                    data=step.parameters,
-                    required_approvers=["financial_manager"],  # This would be configurable
-                    expires_in_minutes=step.timeout_minutes,
-                )
-                
-                # Wait for approval (in a real implementation, this would be event-driven)
-                timeout = datetime.utcnow() + timedelta(minutes=step.timeout_minutes or 60)
-                
-                while datetime.utcnow() < timeout:
-                    if approval_request.is_approved:
-                        step.status = AgentStatus.COMPLETED
-                        step.completed_at = datetime.utcnow()
-                        
-                        return {
-                            "success": True,
-                            "approved": True,
-                            "approval_id": approval_request.id,
-                        }
-                    
-                    elif approval_request.status == "rejected":
-                        step.status = AgentStatus.ERROR
-                        step.error = "Approval rejected"
-                        step.completed_at = datetime.utcnow()
-                        
-                        return {
-                            "success": False,
-                            "error": "Approval rejected",
-                            "approval_id": approval_request.id,
-                        }
-                    
-                    # Wait before checking again
-                    await asyncio.sleep(1)
-                
-                # Timeout reached
-                step.status = AgentStatus.ERROR
-                step.error = "Approval timeout"
-                step.completed_at = datetime.utcnow()
-                
+        trace.get_current_span().add_event(
+            "workflow_engine.approval_step",
+            {"step_id": step.step_id},
+        )
+        
+        try:
+            # Create approval request
+            approval_request = workflow_state.add_approval_request(
+                agent_id="workflow_engine",
+                request_type="workflow_approval",
+                description=step.description,
+                data=step.parameters,
+                required_approvers=["financial_manager"],  # This would be configurable
+                expires_in_minutes=step.timeout_minutes,
+            )
+            
+            # Sleep until approve_request() records a decision (or the step times out)
+            await approval_request.wait_for_decision(timeout=(step.timeout_minutes or 60) * 60)
+            
+            if approval_request.is_approved:
                 return {
-                    "success": False,
-                    "error": "Approval timeout",
+                    "success": True,
+                    "approved": True,
                     "approval_id": approval_request.id,
                 }
-                
-            except Exception as e:
-                step.status = AgentStatus.ERROR
-                step.error = str(e)
-                step.completed_at = datetime.utcnow()
-                
+            
+            elif approval_request.status == "rejected":
                 return {
                     "success": False,
-                    "error": str(e),
+                    "error": "Approval rejected",
+                    "approval_id": approval_request.id,
                 }
+            
+            # Timeout reached
+            return {
+                "success": False,
+                "error": "Approval timeout",
+                "approval_id": approval_request.id,
+            }
+            
+        except Exception as e:
+            return {
+                "success": False,
+                "error": str(e),
+            }
+    
+    def _step_cache_key(
+        self,
+        step: WorkflowStep,
+        workflow_state: WorkflowState,
+        workflow_data_json: bytes,
+    ) -> str:
+        """Build the result-cache key for an agent step.
+        
+        The key covers the agent, the full request and the company/user the
+        workflow runs for, so results are never shared across tenants. Only
+        called for workflows with a context. The static part of the request
+        comes pre-serialized from the step.
+        
+        Args:
+            step: Workflow step
+            workflow_state: Workflow state
+            workflow_data_json: Encoded workflow data
+            
+        Returns:
+            Hex digest identifying the invocation
+        """
+        context = workflow_state.context
+        scope = [context.company_id, context.user_id]
+        
+        hasher = hashlib.blake2b(orjson.dumps([step.agent_id, scope]), digest_size=16)
+        hasher.update(step.request_template_json)
+        hasher.update(workflow_data_json)
+        return hasher.hexdigest()
+    
+    def _get_cached_step_result(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a fresh cached step result.
+        
+        Args:
+            key: Cache key from _step_cache_key
+            
+        Returns:
+            Copy of the cached result, or None on a miss or expired entry
+        """
+        entry = self._step_cache.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._step_cache[key]
+            return None
+        
+        self._step_cache.move_to_end(key)
+        return dict(result)
+    
+    def _cache_step_result(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a successful step result in the LRU cache.
+        
+        Args:
+            key: Cache key from _step_cache_key
+            result: Agent result to cache
+        """
+        expires_at = time.monotonic() + settings.workflow.step_cache_ttl_seconds
+        self._step_cache[key] = (expires_at, dict(result))
+        self._step_cache.move_to_end(key)
+        if len(self._step_cache) > settings.workflow.step_cache_size:
+            self._step_cache.popitem(last=False)
     
     def get_workflow_definition(self, workflow_type: str) -> Optional[WorkflowDefinition]:
         """Get workflow definition by type.
@@ -565,10 +788,10 @@ class WorkflowEngine:
         """
         return list(self.workflow_definitions.keys())
     
-    def get_active_executions(self) -> Dict[str, WorkflowState]:
+    def get_active_executions(self) -> Mapping[str, WorkflowState]:
         """Get all active workflow executions.
         
         Returns:
-            Dictionary of active executions
+            Read-only snapshot of active executions
         """
-        return self.active_executions.copy()
\ No newline at end of file
+        return MappingProxyType(self.active_executions)
\ No newline at end of file
@@ -105,88 +105,81 @@ async def demo_tool_execution(tool_hub):
         title="🔧 Financial Tools"
     ))
     
-    # Demo 1: Financial Ratio Calculation
-    console.print("[bold]Demo 1: Financial Ratio Calculation[/bold]")
+    sample_cash_flows = [
+        {"period": "2024-01", "net_cash_flow": 25000},
+        {"period": "2024-02", "net_cash_flow": 32000},
+        {"period": "2024-03", "net_cash_flow": 28000},
+        {"period": "2024-04", "net_cash_flow": 35000},
+        {"period": "2024-05", "net_cash_flow": 30000},
+        {"period": "2024-06", "net_cash_flow": 38000},
+    ]
     
+    # The two tools are independent, so run them concurrently
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task("Calculating current ratio...", total=None)
+        task = progress.add_task("Calculating current ratio and analyzing cash flow trends...", total=None)
         
-        result = await tool_hub.execute_tool(
-            tool_name="financial_ratio_calculator",
-            parameters={
-                "ratio_type": "current_ratio",
-                "financial_data": {
-                    "current_assets": 150000,
-                    "current_liabilities": 75000
+        ratio_result, cash_flow_result = await asyncio.gather(
+            tool_hub.execute_tool(
+                tool_name="financial_ratio_calculator",
+                parameters={
+                    "ratio_type": "current_ratio",
+                    "financial_data": {
+                        "current_assets": 150000,
+                        "current_liabilities": 75000
+                    }
+                }
+            ),
+            tool_hub.execute_tool(
+                tool_name="cash_flow_analyzer",
+                parameters={
+                    "cash_flows": sample_cash_flows,
+                    "analysis_type": "comprehensive"
                 }
-            }
+            ),
         )
         
         progress.remove_task(task)
     
-    if result.success:
+    # Demo 1: Financial Ratio Calculation
+    console.print("[bold]Demo 1: Financial Ratio Calculation[/bold]")
+    
+    if ratio_result.success:
         console.print(Panel(
-            f"[green]Current Ratio: {result.data['ratio']:.2f}[/green]\n"
-            f"Current Assets: ${result.data['current_assets']:,.2f}\n"
-            f"Current Liabilities: ${result.data['current_liabilities']:,.2f}\n"
-            f"Interpretation: {result.data['interpretation']}\n"
-            f"Execution Time: {result.execution_time:.3f}s",
+            f"[green]Current Ratio: {ratio_result.data['ratio']:.2f}[/green]\n"
+            f"Current Assets: ${ratio_result.data['current_assets']:,.2f}\n"
+            f"Current Liabilities: ${ratio_result.data['current_liabilities']:,.2f}\n"
+            f"Interpretation: {ratio_result.data['interpretation']}\n"
+            f"Execution Time: {ratio_result.execution_time:.3f}s",
             title="✅ Ratio Analysis Result",
             border_style="green"
         ))
     else:
-        console.print(f"[red]Error: {result.error}[/red]")
+        console.print(f"[red]Error: {ratio_result.error}[/red]")
     
     console.print()
     
     # Demo 2: Cash Flow Analysis
     console.print("[bold]Demo 2: Cash Flow Analysis[/bold]")
     
-    sample_cash_flows = [
-        {"period": "2024-01", "net_cash_flow": 25000},
-        {"period": "2024-02", "net_cash_flow": 32000},
-        {"period": "2024-03", "net_cash_flow": 28000},
-        {"period": "2024-04", "net_cash_flow": 35000},
-        {"period": "2024-05", "net_cash_flow": 30000},
-        {"period": "2024-06", "net_cash_flow": 38000},
-    ]
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Analyzing cash flow trends...", total=None)
-        
-        result = await tool_hub.execute_tool(
-            tool_name="cash_flow_analyzer",
-            parameters={
-                "cash_flows": sample_cash_flows,
-                "analysis_type": "comprehensive"
-            }
-        )
-        
-        progress.remove_task(task)
-    
-    if result.success:
-        trend_data = result.data["trend_analysis"]
-        volatility_data = result.data["volatility_analysis"]
+    if cash_flow_result.success:
+        trend_data = cash_flow_result.data["trend_analysis"]
+        volatility_data = cash_flow_result.data["volatility_analysis"]
         
         console.print(Panel(
             f"[green]Cash Flow Trend: {trend_data['trend']}[/green]\n"
             f"Average Change: {trend_data['average_change_percent']:.1f}%\n"
             f"Volatility Level: {volatility_data['volatility_level']}\n"
             f"Average Flow: ${volatility_data['mean_cash_flow']:,.2f}\n"
-            f"Positive Periods: {result.data['positive_periods']}/{len(sample_cash_flows)}",
+            f"Positive Periods: {cash_flow_result.data['positive_periods']}/{len(sample_cash_flows)}",
             title="📈 Cash Flow Analysis Result",
             border_style="green"
         ))
     else:
-        console.print(f"[red]Error: {result.error}[/red]")
+        console.print(f"[red]Error: {cash_flow_result.error}[/red]")
     
     console.print()
 
@@ -0,0 +1,133 @@
+"""Tests for the Redis-backed context manager."""
+
+import pytest
+import asyncio
+
+fakeredis = pytest.importorskip("fakeredis")
+# redis-py locks release through a Lua script
+pytest.importorskip("lupa")
+
+from ai_financial.orchestrator.context_manager import ContextManager
+
+
+class TestContextManager:
+    """Test context lifecycle, shared state and statistics."""
+
+    @pytest.fixture
+    async def manager(self):
+        """Context manager on an isolated in-memory Redis."""
+        redis_client = fakeredis.aioredis.FakeRedis(server=fakeredis.FakeServer(), decode_responses=True)
+        yield ContextManager(redis_client)
+        await redis_client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_create_and_get_context(self, manager):
+        """Test that a created context round-trips through Redis with a TTL."""
+        context = await manager.create_context(
+            agent_id="ai_cfo_agent",
+            user_id="user_1",
+            company_id="company_1",
+            permissions=["read_financial_data"],
+            initial_state={"quarter": "Q3"},
+        )
+
+        loaded = await manager.get_context(context.session_id)
+
+        assert loaded == context
+        assert loaded.state == {"quarter": "Q3"}
+        ttl = await manager._redis.ttl(f"ctx:{context.session_id}")
+        assert 0 < ttl <= manager.context_ttl_minutes * 60
+        assert await manager.get_context("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_update_context_state(self, manager):
+        """Test merge and replace updates, keeping the context's TTL."""
+        context = await manager.create_context("agent", "user_1", "company_1", initial_state={"a": 1})
+        key = f"ctx:{context.session_id}"
+        await manager._redis.expire(key, 120)
+
+        assert await manager.update_context_state(context.session_id, {"b": 2}) is True
+        assert (await manager.get_context(context.session_id)).state == {"a": 1, "b": 2}
+
+        assert await manager.update_context_state(context.session_id, {"c": 3}, merge=False) is True
+        assert (await manager.get_context(context.session_id)).state == {"c": 3}
+
+        assert 0 < await manager._redis.ttl(key) <= 120
+
+    @pytest.mark.asyncio
+    async def test_update_after_expiry_returns_false(self, manager):
+        """Test that an expired context is neither updated nor recreated."""
+        context = await manager.create_context("agent", "user_1", "company_1")
+        await manager._redis.pexpire(f"ctx:{context.session_id}", 1)
+        await asyncio.sleep(0.01)
+
+        assert await manager.update_context_state(context.session_id, {"a": 1}) is False
+        assert await manager.get_context(context.session_id) is None
+
+        # A context expiring between read and write must not be written back
+        assert await manager._store_context(context, keep_ttl=True) is False
+        assert await manager.get_context(context.session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_share_context_data(self, manager):
+        """Test sharing selected keys and all state between contexts."""
+        source = await manager.create_context("agent_a", "user_1", "company_1", initial_state={"x": 1, "y": 2})
+        target = await manager.create_context("agent_b", "user_1", "company_1", initial_state={"z": 3})
+
+        assert await manager.share_context_data(source.session_id, target.session_id, keys=["x", "missing"]) is True
+        assert (await manager.get_context(target.session_id)).state == {"z": 3, "x": 1}
+
+        assert await manager.share_context_data(source.session_id, target.session_id) is True
+        assert (await manager.get_context(target.session_id)).state == {"z": 3, "x": 1, "y": 2}
+
+        assert await manager.share_context_data(source.session_id, "missing") is False
+
+    @pytest.mark.asyncio
+    async def test_shared_state(self, manager):
+        """Test per-company shared state values round-trip as JSON."""
+        await manager.update_shared_state("company_1", "limits", {"cash_floor": 10000})
+        await manager.update_shared_state("company_1", "currency", "VND")
+        await manager.update_shared_state("company_2", "currency", "USD")
+
+        assert await manager.get_shared_state("company_1", "limits") == {"cash_floor": 10000}
+        assert await manager.get_shared_state("company_1", "missing") is None
+        assert await manager.get_shared_state("company_1") == {
+            "limits": {"cash_floor": 10000},
+            "currency": "VND",
+        }
+        assert await manager.get_shared_state("company_3") == {}
+
+    @pytest.mark.asyncio
+    async def test_context_statistics(self, manager):
+        """Test statistics aggregate every active context in Redis."""
+        empty = await manager.get_context_statistics()
+        assert empty["active_contexts"] == 0
+        assert empty["average_context_age_minutes"] == 0
+
+        await manager.create_context("ai_cfo_agent", "user_1", "company_1")
+        await manager.create_context("ai_cfo_agent", "user_2", "company_1")
+        await manager.create_context("alert_agent", "user_3", "company_2")
+        await manager.update_shared_state("company_1", "currency", "VND")
+
+        stats = await manager.get_context_statistics()
+
+        assert stats["active_contexts"] == 3
+        assert stats["shared_state_companies"] == 1
+        assert stats["contexts_by_company"] == {"company_1": 2, "company_2": 1}
+        assert stats["contexts_by_agent"] == {"ai_cfo_agent": 2, "alert_agent": 1}
+        assert 0 <= stats["average_context_age_minutes"] <= stats["oldest_context_age_minutes"] < 1
+        assert stats["context_ttl_minutes"] == manager.context_ttl_minutes
+
+    @pytest.mark.asyncio
+    async def test_cleanup_and_clear(self, manager):
+        """Test removing one context and then everything."""
+        first = await manager.create_context("agent", "user_1", "company_1")
+        await manager.create_context("agent", "user_2", "company_1")
+        await manager.update_shared_state("company_1", "currency", "VND")
+
+        assert await manager.cleanup_context(first.session_id) is True
+        assert await manager.cleanup_context(first.session_id) is False
+
+        assert await manager.clear_all_contexts() == 1
+        assert (await manager.get_context_statistics())["active_contexts"] == 0
+        assert await manager.get_shared_state("company_1") == {}
@@ -0,0 +1,219 @@
+"""Tests for the workflow engine scheduler."""
+
+import pytest
+import asyncio
+
+from ai_financial.models.agent_models import AgentContext, WorkflowState
+from ai_financial.orchestrator.workflow_engine import (
+    WorkflowDefinition,
+    WorkflowEngine,
+    WorkflowStep,
+    WorkflowStepType,
+)
+
+
+def make_state(workflow_type: str) -> WorkflowState:
+    """Build a workflow state with a tenant context."""
+    return WorkflowState(
+        workflow_type=workflow_type,
+        context=AgentContext(agent_id="test", user_id="user_1", company_id="company_1"),
+    )
+
+
+async def approve_when_pending(workflow_state: WorkflowState, approved: bool) -> None:
+    """Decide the first approval request as soon as the engine raises it."""
+    while not workflow_state.pending_approvals:
+        await asyncio.sleep(0)
+    workflow_state.approve_request(workflow_state.pending_approvals[0].id, "financial_manager", approved)
+
+
+class TestWorkflowEngine:
+    """Test wave scheduling, failure handling, approvals and timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_in_parallel_waves(self):
+        """Test that steps sharing a wave run concurrently and in dependency order."""
+        engine = WorkflowEngine()
+        in_flight = 0
+        max_in_flight = 0
+        calls = []
+
+        async def executor(agent_id, request, context):
+            nonlocal in_flight, max_in_flight
+            calls.append(agent_id)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"success": True, "agent_id": agent_id}
+
+        result = await engine.execute_workflow("advisory", make_state("advisory"), executor)
+
+        assert result["success"] is True
+        assert result["completed_steps"][:2] == ["data_sync", "financial_analysis"]
+        assert result["completed_steps"][-1] == "executive_reporting"
+        assert set(result["step_results"]) == set(result["completed_steps"])
+        # forecasting and risk_assessment only depend on financial_analysis
+        assert max_in_flight == 2
+        assert set(calls[2:4]) == {"forecasting_agent", "alert_agent"}
+
+    @pytest.mark.asyncio
+    async def test_failed_step_cancels_rest_of_wave(self):
+        """Test that a failure mid-wave cancels sibling steps and stops the workflow."""
+        engine = WorkflowEngine()
+        cancelled = []
+        calls = []
+
+        async def executor(agent_id, request, context):
+            calls.append(agent_id)
+            if agent_id == "alert_agent":
+                return {"success": False, "error": "rules engine down"}
+            if agent_id == "forecasting_agent":
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(agent_id)
+                    raise
+            return {"success": True}
+
+        workflow_state = make_state("advisory")
+        result = await asyncio.wait_for(
+            engine.execute_workflow("advisory", workflow_state, executor),
+            timeout=5,
+        )
+
+        assert result["success"] is False
+        assert result["failed_step"] == "risk_assessment"
+        assert "rules engine down" in result["error"]
+        assert cancelled == ["forecasting_agent"]
+        assert "reporting_agent" not in calls
+        assert "forecasting" not in workflow_state.steps_completed
+        assert engine.get_active_executions() == {}
+
+    @pytest.mark.asyncio
+    async def test_approval_wakes_waiting_step(self):
+        """Test that approving a request resumes the workflow immediately."""
+        engine = WorkflowEngine()
+        workflow_state = make_state("transactional")
+
+        async def executor(agent_id, request, context):
+            return {"success": True}
+
+        approver = asyncio.create_task(approve_when_pending(workflow_state, approved=True))
+        result = await asyncio.wait_for(
+            engine.execute_workflow("transactional", workflow_state, executor),
+            timeout=5,
+        )
+        await approver
+
+        assert result["success"] is True
+        assert result["step_results"]["approval_check"]["approved"] is True
+        assert workflow_state.steps_completed[-2:] == ["reconciliation", "compliance_audit"]
+
+    @pytest.mark.asyncio
+    async def test_rejection_wakes_waiting_step(self):
+        """Test that rejecting a request fails the approval step immediately."""
+        engine = WorkflowEngine()
+        workflow_state = make_state("transactional")
+        calls = []
+
+        async def executor(agent_id, request, context):
+            calls.append(agent_id)
+            return {"success": True}
+
+        approver = asyncio.create_task(approve_when_pending(workflow_state, approved=False))
+        result = await asyncio.wait_for(
+            engine.execute_workflow("transactional", workflow_state, executor),
+            timeout=5,
+        )
+        await approver
+
+        assert result["success"] is False
+        assert result["failed_step"] == "approval_check"
+        assert "Approval rejected" in result["error"]
+        assert "reconciliation_agent" not in calls
+
+    @pytest.mark.asyncio
+    async def test_agent_step_timeout(self):
+        """Test that a slow agent step fails with a timeout result."""
+        engine = WorkflowEngine()
+        workflow_def = WorkflowDefinition(
+            workflow_id="slow",
+            name="Slow Workflow",
+            description="Single slow agent step",
+            workflow_type="slow",
+        )
+        workflow_def.add_step(WorkflowStep(
+            step_id="slow_step",
+            step_type=WorkflowStepType.AGENT_TASK,
+            name="Slow Step",
+            description="Never finishes in time",
+            agent_id="slow_agent",
+            timeout_minutes=0.001,
+        ))
+        engine.workflow_definitions["slow"] = workflow_def
+
+        async def executor(agent_id, request, context):
+            await asyncio.sleep(10)
+            return {"success": True}
+
+        result = await asyncio.wait_for(
+            engine.execute_workflow("slow", make_state("slow"), executor),
+            timeout=5,
+        )
+
+        assert result["success"] is False
+        assert result["failed_step"] == "slow_step"
+        assert "timed out" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_approval_step_timeout(self):
+        """Test that an undecided approval fails once the step times out."""
+        engine = WorkflowEngine()
+        workflow_def = WorkflowDefinition(
+            workflow_id="approval_only",
+            name="Approval Workflow",
+            description="Single approval step",
+            workflow_type="approval_only",
+        )
+        workflow_def.add_step(WorkflowStep(
+            step_id="approval",
+            step_type=WorkflowStepType.APPROVAL,
+            name="Approval",
+            description="Nobody answers",
+            timeout_minutes=0.001,
+        ))
+        engine.workflow_definitions["approval_only"] = workflow_def
+
+        async def executor(agent_id, request, context):
+            return {"success": True}
+
+        result = await asyncio.wait_for(
+            engine.execute_workflow("approval_only", make_state("approval_only"), executor),
+            timeout=5,
+        )
+
+        assert result["success"] is False
+        assert result["failed_step"] == "approval"
+        assert "Approval timeout" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_only_cacheable_steps_are_reused(self):
+        """Test that a rerun re-executes steps with side effects."""
+        engine = WorkflowEngine()
+        calls = []
+
+        async def executor(agent_id, request, context):
+            calls.append(agent_id)
+            return {"success": True}
+
+        await engine.execute_workflow("advisory", make_state("advisory"), executor)
+        calls.clear()
+        await engine.execute_workflow("advisory", make_state("advisory"), executor)
+
+        assert calls == ["data_sync_agent", "reporting_agent"]
+
+        # Without a tenant context nothing is cached
+        calls.clear()
+        await engine.execute_workflow("advisory", WorkflowState(workflow_type="advisory"), executor)
+        assert len(calls) == 5